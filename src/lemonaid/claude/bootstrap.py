@@ -177,17 +177,21 @@ def run_bootstrap(dry_run: bool = False) -> BootstrapResult:
         if dry_run or not result.imported:
             return result
 
-        for entry in result.imported:
-            db.add(
-                conn,
-                channel=entry.channel,
-                message=entry.message,
-                name=entry.name,
-                metadata=entry.metadata,
-                upsert=False,
-                created_at=entry.created_at,
-                status="archived",
-            )
+        db.add_many(
+            conn,
+            (
+                (
+                    entry.channel,
+                    entry.message,
+                    entry.name,
+                    entry.metadata,
+                    entry.created_at,
+                    None,
+                    "archived",
+                )
+                for entry in result.imported
+            ),
+        )
 
     _log.info(
         "bootstrap: imported=%d, skipped_existing=%d, skipped_sidechain=%d",
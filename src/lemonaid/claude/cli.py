@@ -2,11 +2,8 @@
 
 import argparse
 
-from .bootstrap import run_bootstrap
 from .notify import dismiss_session, handle_dismiss, handle_notification
-from .patcher import apply_patch, check_status, find_binary, restore_backup
 from .resume import resume_session
-from .summarize import run_summarize
 
 
 def cmd_notify(args: argparse.Namespace) -> None:
@@ -26,6 +23,8 @@ def cmd_dismiss(args: argparse.Namespace) -> None:
 
 def cmd_patch(args: argparse.Namespace) -> None:
     """Patch Claude Code to reduce notification delay."""
+    from .patcher import apply_patch, check_status, find_binary
+
     binary = find_binary()
     if not binary:
         print("Could not find Claude Code binary")
@@ -53,6 +52,8 @@ def cmd_patch(args: argparse.Namespace) -> None:
 
 def cmd_patch_status(args: argparse.Namespace) -> None:
     """Check Claude Code patch status."""
+    from .patcher import check_status, find_binary
+
     binary = find_binary()
     if not binary:
         print("Could not find Claude Code binary")
@@ -65,6 +66,8 @@ def cmd_patch_status(args: argparse.Namespace) -> None:
 
 def cmd_bootstrap(args: argparse.Namespace) -> None:
     """Import historical Claude sessions into the lemonaid archive."""
+    from .bootstrap import run_bootstrap
+
     result = run_bootstrap(dry_run=args.dry_run)
     n_imported = len(result.imported)
 
@@ -86,6 +89,8 @@ def cmd_bootstrap(args: argparse.Namespace) -> None:
 
 def cmd_summarize(args: argparse.Namespace) -> None:
     """Summarize sessions with poor names using Claude."""
+    from .summarize import run_summarize
+
     result = run_summarize(dry_run=args.dry_run)
 
     if args.dry_run:
@@ -107,6 +112,8 @@ def cmd_summarize(args: argparse.Namespace) -> None:
 
 def cmd_patch_restore(args: argparse.Namespace) -> None:
     """Restore Claude Code from backup."""
+    from .patcher import find_binary, restore_backup
+
     binary = find_binary()
     if not binary:
         print("Could not find Claude Code binary")
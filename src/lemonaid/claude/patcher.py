@@ -7,6 +7,7 @@ patches the binary to reduce that to 500ms.
 See: https://github.com/anthropics/claude-code/issues/5186
 """
 
+import json
 import platform
 import re
 import shutil
@@ -174,6 +175,46 @@ def check_status(binary_path: Path) -> str:
         return "unknown"
 
 
+def _status_cache_path() -> Path:
+    return Path.home() / ".local" / "state" / "lemonaid" / "claude-patch-status.json"
+
+
+def _binary_fingerprint(binary_path: Path) -> list:
+    st = binary_path.stat()
+    return [str(binary_path), st.st_size, st.st_mtime_ns]
+
+
+def cached_status(binary_path: Path) -> str | None:
+    """Return the status recorded for this exact binary, or None if it wasn't checked.
+
+    check_status() reads the whole (~180MB) binary; a binary that hasn't
+    changed since (same path, size and mtime) still has the same status.
+    """
+    try:
+        cached = json.loads(_status_cache_path().read_text())
+        if cached["binary"] == _binary_fingerprint(binary_path):
+            return cached["status"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def record_status(binary_path: Path, status: str) -> None:
+    """Remember a check_status() result for cached_status().
+
+    Only definite results are kept: "unknown" may just mean this lemonaid
+    doesn't know the binary's patterns yet, and a newer one might.
+    """
+    if status not in ("patched", "unpatched"):
+        return
+    try:
+        path = _status_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"binary": _binary_fingerprint(binary_path), "status": status}))
+    except OSError:
+        pass
+
+
 def apply_patch(binary_path: Path, backup: bool = True) -> int:
     """Patch the binary. Returns number of locations patched."""
     version = parse_version(binary_path.name)
@@ -8,7 +8,7 @@ Provides Claude-specific functions for the unified watcher:
 
 from pathlib import Path
 
-from ..lemon_watchers import short_filename
+from ..lemon_watchers import first_line, short_filename
 
 # Channel prefix for Claude notifications
 CHANNEL_PREFIX = "claude:"
@@ -58,11 +58,8 @@ def describe_activity(entry: dict) -> str | None:
         for block in content:
             if isinstance(block, dict) and block.get("type") == "text":
                 text = block.get("text", "")
-                if text.strip():
-                    first_line = text.strip().split("\n")[0][:200]
-                    if len(first_line) < len(text.strip().split("\n")[0]):
-                        first_line += "..."
-                    return first_line
+                if summary := first_line(text):
+                    return summary
 
     return None
 
@@ -1,10 +1,11 @@
 """Codex CLI notification hook handler."""
 
-import json
 import os
 import sys
+import typing as ty
 from pathlib import Path
 
+from .. import fastjson
 from ..inbox import db
 from ..inbox.channel import channel_id
 from ..lemon_watchers import (
@@ -24,6 +25,37 @@ from .utils import (
 
 _log = get_logger("codex.notify")
 
+# Notify payloads are usually a few KB, but input-messages carries the user's
+# prompts, which can be long. The cap keeps a runaway writer from making us
+# buffer arbitrary amounts of stdin; payloads over it are logged and ignored.
+_STDIN_MAX_BYTES: ty.Final = 1024 * 1024
+
+_TURN_TYPES: ty.Final = frozenset({"agent-turn-complete", "turn-complete", "idle_prompt"})
+
+
+def _compose_message(notification_type: str, cwd: str) -> str:
+    short_path = shorten_path(cwd)
+    if "approval" in notification_type or "permission" in notification_type:
+        return f"Permission needed in {short_path}"
+    if notification_type in _TURN_TYPES:
+        return f"Waiting in {short_path}"
+    return f"{notification_type} in {short_path}"
+
+
+def _read_stdin() -> bytes | None:
+    """Read the hook payload from stdin, or None (with a warning) if it's over the cap."""
+    data = sys.stdin.buffer.read(_STDIN_MAX_BYTES + 1)
+    if len(data) > _STDIN_MAX_BYTES:
+        _log.warning("stdin payload exceeds %d bytes, ignoring it", _STDIN_MAX_BYTES)
+        return None
+    return data
+
+
+def _log_preview(data: str | bytes, limit: int) -> str:
+    """The start of a payload as text, for readable log lines."""
+    preview = data[:limit]
+    return preview.decode("utf-8", "replace") if isinstance(preview, bytes) else preview
+
 
 def _parse_input_messages(data: dict) -> str | None:
     messages = data.get("input-messages") or data.get("input_messages")
@@ -85,7 +117,7 @@ def _resolve_cwd(cwd: str | None, session_path: Path | None) -> str | None:
 
 
 def handle_notification(
-    stdin_data: str | None = None,
+    stdin_data: str | bytes | None = None,
     *,
     session_id: str | None = None,
     session_path: str | None = None,
@@ -101,16 +133,18 @@ def handle_notification(
     a notification to the lemonaid inbox.
     """
     if stdin_data is None:
-        stdin_data = sys.stdin.read()
+        stdin_data = _read_stdin()
+        if stdin_data is None:
+            return
         # Codex notify passes a single JSON argument, not stdin.
         if not stdin_data.strip() and len(sys.argv) > 1 and sys.argv[-1].lstrip().startswith("{"):
             stdin_data = sys.argv[-1]
 
-    _log.info("stdin: %s", stdin_data[:200])
+    _log.info("stdin: %s", _log_preview(stdin_data, 200))
 
     try:
-        data = json.loads(stdin_data) if stdin_data else {}
-    except json.JSONDecodeError:
+        data = fastjson.loads(stdin_data) if stdin_data.strip() else {}
+    except ValueError:
         data = {}
 
     session_path_obj = _resolve_session_path(session_id, cwd, session_path)
@@ -125,13 +159,7 @@ def handle_notification(
     )
 
     if not message:
-        short_path = shorten_path(cwd or "")
-        if "approval" in notification_type or "permission" in notification_type:
-            message = f"Permission needed in {short_path}"
-        elif notification_type in ("agent-turn-complete", "turn-complete", "idle_prompt"):
-            message = f"Waiting in {short_path}"
-        else:
-            message = f"{notification_type} in {short_path}"
+        message = _compose_message(notification_type, cwd or "")
 
     if not name:
         name = (
@@ -204,13 +232,15 @@ def handle_dismiss(debug: bool = False) -> None:
     """Dismiss (mark as read) the notification for this Codex session."""
     debug = debug or os.environ.get("LEMONAID_DEBUG") == "1"
 
-    stdin_raw = sys.stdin.read() or "{}"
+    stdin_raw = _read_stdin()
+    if stdin_raw is None:
+        return
 
-    _log.info("dismiss stdin: %s", stdin_raw[:100])
+    _log.info("dismiss stdin: %s", _log_preview(stdin_raw, 100))
 
     try:
-        data = json.loads(stdin_raw)
-    except json.JSONDecodeError:
+        data = fastjson.loads(stdin_raw) if stdin_raw.strip() else {}
+    except ValueError:
         data = {}
 
     session_id = _extract_session_id(data, None)
@@ -1,9 +1,12 @@
 """Codex session utilities."""
 
-import json
+import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
+from .. import fastjson
+
 
 def get_sessions_root() -> Path:
     """Return the Codex sessions root directory."""
@@ -24,14 +27,14 @@ def extract_session_id_from_filename(name: str) -> str | None:
 def read_session_meta(path: Path) -> dict | None:
     """Read the first session_meta payload from a session file."""
     try:
-        with path.open() as f:
+        with path.open("rb") as f:
             for _ in range(20):
                 line = f.readline()
                 if not line:
                     break
                 try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
+                    entry = fastjson.loads(line)
+                except ValueError:
                     continue
                 if entry.get("type") == "session_meta":
                     return entry.get("payload", {})
@@ -49,14 +52,27 @@ def find_session_path(session_id: str) -> Path | None:
     if not root.exists():
         return None
 
-    pattern = f"*{session_id}.jsonl"
-    for path in root.rglob(pattern):
-        if path.is_file():
-            return path
+    suffix = f"{session_id}.jsonl"
+    for entry in iter_session_files(str(root)):
+        if entry.name.endswith(suffix) and entry.is_file():
+            return Path(entry.path)
 
     return None
 
 
+def iter_session_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield every *.jsonl entry under root, without building Path objects."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_session_files(entry.path)
+        elif entry.name.endswith(".jsonl"):
+            yield entry
+
+
 def find_latest_session_for_cwd(cwd: str) -> Path | None:
     """Find the most recently modified session file for a cwd."""
     if not cwd:
@@ -66,21 +82,20 @@ def find_latest_session_for_cwd(cwd: str) -> Path | None:
     if not root.exists():
         return None
 
-    latest_path: Path | None = None
-    latest_mtime: float = 0.0
-
-    for path in root.rglob("*.jsonl"):
-        meta = read_session_meta(path)
-        if not meta:
-            continue
-        if meta.get("cwd") != cwd:
-            continue
+    # Order candidates by mtime first so we only open files until the newest
+    # one for this cwd turns up, rather than reading the meta of every session.
+    candidates: list[tuple[float, str]] = []
+    for entry in iter_session_files(str(root)):
         try:
-            mtime = path.stat().st_mtime
+            candidates.append((entry.stat().st_mtime, entry.path))
         except OSError:
             continue
-        if mtime > latest_mtime:
-            latest_mtime = mtime
-            latest_path = path
+    candidates.sort(reverse=True)
 
-    return latest_path
+    for _mtime, file_path in candidates:
+        path = Path(file_path)
+        meta = read_session_meta(path)
+        if meta and meta.get("cwd") == cwd:
+            return path
+
+    return None
@@ -6,10 +6,13 @@ Provides Codex-specific functions for the unified watcher:
 - should_dismiss: Detect when to auto-dismiss notifications
 """
 
-import json
+import typing as ty
+from datetime import date, timedelta
 from pathlib import Path
 
-from .utils import get_sessions_root
+from .. import fastjson
+from ..lemon_watchers import first_line
+from .utils import get_sessions_root, iter_session_files
 
 # Channel prefix for Codex notifications
 CHANNEL_PREFIX = "codex:"
@@ -31,19 +34,28 @@ def get_session_path(session_id: str, cwd: str) -> Path | None:
     if not root.exists():
         return None
 
-    # Try exact match first (recursive search)
-    pattern = f"**/*{session_id}.jsonl"
-    for path in root.glob(pattern):
-        if path.is_file():
-            return path
-
-    # Try partial match (first 8 chars of UUID)
-    if len(session_id) >= 8:
-        for path in root.rglob("*.jsonl"):
-            if session_id[:8] in path.name:
+    # Recent sessions live under today's (or a recent day's) YYYY/MM/DD
+    # directory; check those before walking the whole tree.
+    today = date.today()
+    for days_ago in range(3):
+        day = today - timedelta(days=days_ago)
+        day_dir = root / f"{day.year:04d}" / f"{day.month:02d}" / f"{day.day:02d}"
+        for path in day_dir.glob(f"*{session_id}.jsonl"):
+            if path.is_file():
                 return path
 
-    return None
+    # Walk the whole tree once: an exact match anywhere wins, otherwise fall
+    # back to the first file containing the UUID's first 8 chars.
+    suffix = f"{session_id}.jsonl"
+    prefix = session_id[:8] if len(session_id) >= 8 else None
+    partial: str | None = None
+    for entry in iter_session_files(str(root)):
+        if entry.name.endswith(suffix) and entry.is_file():
+            return Path(entry.path)
+        if partial is None and prefix and prefix in entry.name:
+            partial = entry.path
+
+    return Path(partial) if partial else None
 
 
 def describe_activity(entry: dict) -> str | None:
@@ -55,85 +67,45 @@ def describe_activity(entry: dict) -> str | None:
     - response_item with function_call: Tool calls
     """
     entry_type = entry.get("type")
+    # Transcript lines are untrusted JSON: a list/dict type would be unhashable
+    describer = _ENTRY_DESCRIBERS.get(entry_type) if isinstance(entry_type, str) else None
+    return describer(entry) if describer else None
 
-    # Shell commands - most common activity
-    if entry_type == "local_shell_call":
-        return _describe_shell_call(entry)
-
-    # Assistant messages with text content
-    if entry_type == "message":
-        role = entry.get("role")
-        if role != "assistant":
-            return None
-        content = entry.get("content", [])
-        if isinstance(content, list):
-            for block in content:
-                if isinstance(block, dict) and block.get("type") in ("output_text", "text"):
-                    text = block.get("text", "")
-                    if text.strip():
-                        first_line = text.strip().split("\n")[0][:200]
-                        if len(first_line) < len(text.strip().split("\n")[0]):
-                            first_line += "..."
-                        return first_line
-
-    # response_item format
-    if entry_type == "response_item":
-        payload = entry.get("payload", {})
-        payload_type = payload.get("type")
-
-        if payload_type == "function_call":
-            return _describe_function_call(payload)
-
-        if payload_type == "web_search_call":
-            action = payload.get("action", {})
-            if isinstance(action, dict):
-                query = action.get("query")
-                if isinstance(query, str) and query:
-                    return f"Searching: {query[:80]}"
-            return "Web search"
-
-        if payload_type == "message":
-            role = payload.get("role")
-            if role == "assistant":
-                content = payload.get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "output_text":
-                            text = block.get("text", "")
-                            if text.strip():
-                                first_line = text.strip().split("\n")[0][:200]
-                                if len(first_line) < len(text.strip().split("\n")[0]):
-                                    first_line += "..."
-                                return first_line
 
-    return None
+_DISMISS_ROLES = frozenset({"assistant", "user"})
+_DISMISS_PAYLOAD_TYPES = frozenset({"function_call", "web_search_call", "reasoning"})
 
 
 def should_dismiss(entry: dict) -> bool:
     """Check if a session entry indicates we should dismiss the notification."""
     entry_type = entry.get("type")
 
+    # response_item is by far the most common entry type, so test it first.
+    if entry_type == "response_item":
+        payload = entry.get("payload")
+        if not isinstance(payload, dict):
+            return False
+        payload_type = payload.get("type")
+        if not isinstance(payload_type, str):
+            return False
+        return payload_type in _DISMISS_PAYLOAD_TYPES or (
+            payload_type == "message" and _is_dismiss_role(payload.get("role"))
+        )
+
     if entry_type == "local_shell_call":
         return True
 
     if entry_type == "message":
-        role = entry.get("role")
-        if role in ("assistant", "user"):
-            return True
-
-    if entry_type == "response_item":
-        payload = entry.get("payload", {})
-        payload_type = payload.get("type")
-        if payload_type in ("function_call", "web_search_call", "reasoning"):
-            return True
-        if payload_type == "message":
-            role = payload.get("role")
-            if role in ("assistant", "user"):
-                return True
+        return _is_dismiss_role(entry.get("role"))
 
     return False
 
 
+def _is_dismiss_role(role: object) -> bool:
+    # Set lookups hash the value, so non-string roles (lists, dicts) are rejected first
+    return isinstance(role, str) and role in _DISMISS_ROLES
+
+
 def needs_attention(entry: dict) -> bool:
     """Check if an entry indicates the agent is waiting for user input.
 
@@ -172,31 +144,101 @@ def _describe_command(cmd: str) -> str:
     return f"Running: {cmd}"
 
 
+def _function_args(payload: dict) -> dict:
+    """Decode a function_call's JSON arguments, or {} if absent/invalid."""
+    args_raw = payload.get("arguments", "")
+    if not isinstance(args_raw, str) or not args_raw:
+        return {}
+    try:
+        args = fastjson.loads(args_raw)
+    except ValueError:
+        return {}
+    return args if isinstance(args, dict) else {}
+
+
 def _describe_function_call(payload: dict) -> str:
-    """Describe a function_call payload."""
+    """Describe a function_call payload.
+
+    Arguments are only decoded for the tools whose description uses them.
+    """
     name = payload.get("name", "unknown")
-    args_raw = payload.get("arguments", "")
-    args: dict | None = None
-    if isinstance(args_raw, str) and args_raw:
-        try:
-            args = json.loads(args_raw)
-        except json.JSONDecodeError:
-            args = None
 
     if name == "shell_command":
-        cmd = ""
-        if isinstance(args, dict):
-            cmd = args.get("command", "") or ""
+        cmd = _function_args(payload).get("command", "") or ""
         if cmd:
             return _describe_command(cmd)
         return "Running command"
 
     if name == "read_mcp_resource":
-        uri = ""
-        if isinstance(args, dict):
-            uri = args.get("uri", "") or ""
+        uri = _function_args(payload).get("uri", "") or ""
         if uri:
             return f"Reading {uri[:80]}"
         return "Reading resource"
 
     return f"Using {name}"
+
+
+def _first_text(content: ty.Any, block_types: frozenset[str]) -> str | None:
+    """First line of the first non-empty text block, truncated to 200 chars."""
+    if not isinstance(content, list):
+        return None
+    for block in content:
+        if (
+            isinstance(block, dict)
+            and block.get("type") in block_types
+            and (summary := first_line(block.get("text", "")))
+        ):
+            return summary
+    return None
+
+
+_MESSAGE_TEXT_TYPES = frozenset({"output_text", "text"})
+_OUTPUT_TEXT_TYPES = frozenset({"output_text"})
+
+
+def _describe_message(entry: dict) -> str | None:
+    """Describe a top-level assistant message entry."""
+    if entry.get("role") != "assistant":
+        return None
+    return _first_text(entry.get("content", []), _MESSAGE_TEXT_TYPES)
+
+
+def _describe_web_search(payload: dict) -> str:
+    """Describe a web_search_call payload."""
+    action = payload.get("action", {})
+    if isinstance(action, dict):
+        query = action.get("query")
+        if isinstance(query, str) and query:
+            return f"Searching: {query[:80]}"
+    return "Web search"
+
+
+def _describe_payload_message(payload: dict) -> str | None:
+    """Describe an assistant message carried in a response_item payload."""
+    if payload.get("role") != "assistant":
+        return None
+    return _first_text(payload.get("content", []), _OUTPUT_TEXT_TYPES)
+
+
+_PAYLOAD_DESCRIBERS: dict[str, ty.Callable[[dict], str | None]] = {
+    "function_call": _describe_function_call,
+    "web_search_call": _describe_web_search,
+    "message": _describe_payload_message,
+}
+
+
+def _describe_response_item(entry: dict) -> str | None:
+    """Describe a response_item entry by its payload type."""
+    payload = entry.get("payload")
+    if not isinstance(payload, dict):
+        return None
+    payload_type = payload.get("type")
+    describer = _PAYLOAD_DESCRIBERS.get(payload_type) if isinstance(payload_type, str) else None
+    return describer(payload) if describer else None
+
+
+_ENTRY_DESCRIBERS: dict[str, ty.Callable[[dict], str | None]] = {
+    "local_shell_call": _describe_shell_call,
+    "message": _describe_message,
+    "response_item": _describe_response_item,
+}
@@ -1,10 +1,10 @@
 """Configuration management for lemonaid."""
 
-import tomllib
-from dataclasses import dataclass, field
+import functools
+from dataclasses import dataclass, field, fields
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 
 def get_config_path() -> Path:
@@ -14,8 +14,11 @@ def get_config_path() -> Path:
 
 
 def get_default_config() -> str:
-    """Return the default config file contents."""
-    return """\
+    """Return the default config file contents.
+
+    Values come from the config dataclasses so the file can't drift from them.
+    """
+    return f"""\
 # Lemonaid configuration
 
 # Switch-handlers are auto-selected based on the notification's switch-source.
@@ -24,7 +27,7 @@ def get_default_config() -> str:
 [wezterm]
 # How to resolve pane from notification metadata
 # Options: "tty" (match TTY to pane), "metadata" (use workspace/pane_id from metadata)
-resolve_pane = "tty"
+resolve_pane = "{WeztermConfig().resolve_pane}"
 """
 
 
@@ -111,13 +114,33 @@ class Config:
         return None
 
 
+# (path, mtime_ns, size) of the last config file parsed, and the result.
+# Configs are treated as read-only once loaded, so callers can share one.
+_config_cache: tuple[Path, int, int, Config] | None = None
+
+
 def load_config(config_path: Path | None = None) -> Config:
-    """Load configuration from file, or return defaults."""
+    """Load configuration from file, or return defaults.
+
+    The parsed config is reused until the file's mtime or size changes.
+    """
+    global _config_cache
+
     if config_path is None:
         config_path = get_config_path()
 
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
         return Config()
+    if st.st_size == 0:
+        return Config()  # an empty stub overrides nothing; skip reading and parsing
+
+    cached = _config_cache
+    if cached and cached[:3] == (config_path, st.st_mtime_ns, st.st_size):
+        return cached[3]
+
+    import tomllib  # deferred: commands that never parse a config skip the import
 
     try:
         with open(config_path, "rb") as f:
@@ -127,47 +150,39 @@ def load_config(config_path: Path | None = None) -> Config:
         print(f"Warning: Could not load config from {config_path}: {e}")
         return Config()
 
-    return _parse_config(data)
+    config = _parse_config(data)
+    _config_cache = (config_path, st.st_mtime_ns, st.st_size, config)
+    return config
 
 
-def _parse_config(data: dict[str, Any]) -> Config:
-    """Parse config dict into Config object."""
-    handlers = data.get("handlers", {})
+_T = TypeVar("_T")
 
-    wezterm_data = data.get("wezterm", {})
-    wezterm = WeztermConfig(
-        resolve_pane=wezterm_data.get("resolve_pane", "tty"),
-    )
 
-    tmux_session_data = data.get("tmux-session", {})
-    tmux_session = TmuxSessionConfig(
-        templates=tmux_session_data.get("templates", {}),
-        resume_window=tmux_session_data.get("resume_window", 0),
-    )
+@functools.cache
+def _field_names(cls: type) -> frozenset[str]:
+    return frozenset(f.name for f in fields(cls))
 
-    tui_data = data.get("tui", {})
-    keybindings_data = tui_data.get("keybindings", {})
-    # Use dataclass defaults for any unspecified keybindings
-    defaults = KeybindingsConfig()
-    keybindings = KeybindingsConfig(
-        **{
-            field: keybindings_data.get(field, getattr(defaults, field))
-            for field in defaults.__dataclass_fields__
-        }
-    )
-    tui = TuiConfig(
-        transparent=tui_data.get("transparent", False),
-        keybindings=keybindings,
-        backend_labels=tui_data.get("backend_labels", {}),
-    )
 
-    openclaw_data = data.get("openclaw", {})
-    openclaw = OpenclawConfig(
-        remote_host=openclaw_data.get("remote_host"),
-    )
+def _from_table(cls: type[_T], table: dict[str, Any]) -> _T:
+    """Build a config dataclass from a TOML table.
+
+    Keys the table leaves out keep the dataclass defaults; unknown keys are ignored.
+    """
+    names = _field_names(cls)
+    return cls(**{k: v for k, v in table.items() if k in names})
+
+
+def _parse_config(data: dict[str, Any]) -> Config:
+    """Parse config dict into Config object."""
+    tui_data = data.get("tui", {})
+    keybindings = _from_table(KeybindingsConfig, tui_data.get("keybindings", {}))
 
     return Config(
-        handlers=handlers, wezterm=wezterm, tmux_session=tmux_session, tui=tui, openclaw=openclaw
+        handlers=data.get("handlers", {}),
+        wezterm=_from_table(WeztermConfig, data.get("wezterm", {})),
+        tmux_session=_from_table(TmuxSessionConfig, data.get("tmux-session", {})),
+        tui=_from_table(TuiConfig, {**tui_data, "keybindings": keybindings}),
+        openclaw=_from_table(OpenclawConfig, data.get("openclaw", {})),
     )
 
 
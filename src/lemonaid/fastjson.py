@@ -0,0 +1,36 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson parses and serializes small payloads several times faster than the
+stdlib, which adds up on the hook and watcher paths that decode JSON on every
+call. It is optional (`pip install 'lemonaid[fast]'`); without it these are
+plain aliases for the json module.
+
+`loads` accepts str or bytes. Invalid UTF-8 in bytes input raises
+UnicodeDecodeError from the stdlib parser, so callers feeding raw bytes should
+catch ValueError (the common base) rather than JSONDecodeError alone.
+"""
+
+import json
+import typing as ty
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one name catches both.
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    loads: ty.Callable[[str | bytes], ty.Any] = orjson.loads
+
+    def dumps(obj: ty.Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+
+else:
+    loads = json.loads
+
+    def dumps(obj: ty.Any) -> str:
+        """Serialize obj to a JSON string."""
+        return json.dumps(obj)
@@ -1,6 +1,5 @@
 """Notification handlers for lemonaid."""
 
-import json
 import subprocess
 from typing import Any
 
@@ -54,23 +53,16 @@ def _handle_wezterm(metadata: dict[str, Any] | None, config: Config) -> bool:
     if metadata is None:
         return False
 
-    workspace = None
-    pane_id = None
-
-    if config.wezterm.resolve_pane == "metadata":
-        # Use workspace/pane_id directly from metadata
-        workspace = metadata.get("workspace")
-        pane_id = metadata.get("pane_id")
-    elif config.wezterm.resolve_pane == "tty":
+    workspace, pane_id = None, None
+    if config.wezterm.resolve_pane == "tty":
         # Resolve from TTY by querying wezterm cli list
         tty = metadata.get("tty")
         if tty:
             workspace, pane_id = _resolve_pane_from_tty(tty)
 
     if workspace is None or pane_id is None:
-        # Fallback to metadata if TTY resolution failed
-        workspace = metadata.get("workspace")
-        pane_id = metadata.get("pane_id")
+        # "metadata" mode, or TTY resolution failed: use workspace/pane_id from metadata
+        workspace, pane_id = metadata.get("workspace"), metadata.get("pane_id")
 
     if workspace is None or pane_id is None:
         return False
@@ -78,25 +70,37 @@ def _handle_wezterm(metadata: dict[str, Any] | None, config: Config) -> bool:
     return wezterm.navigation.switch_to_pane(workspace, pane_id)
 
 
+# TTY index of the last wezterm pane list seen, rebuilt when the list changes
+_tty_index: tuple[list[dict], dict[str, tuple[str | None, int | None]]] | None = None
+
+
+def _wezterm_panes_by_tty() -> dict[str, tuple[str | None, int | None]]:
+    """Map each WezTerm pane's TTY to its (workspace, pane_id)."""
+    global _tty_index
+
+    panes = wezterm.navigation.list_panes()
+    if _tty_index is not None and _tty_index[0] is panes:
+        return _tty_index[1]
+
+    index: dict[str, tuple[str | None, int | None]] = {}
+    for pane in panes:
+        tty = pane.get("tty_name")
+        if tty and tty not in index:
+            index[tty] = (pane.get("workspace"), pane.get("pane_id"))
+    _tty_index = (panes, index)
+    return index
+
+
 def _resolve_pane_from_tty(tty: str) -> tuple[str | None, int | None]:
     """Resolve workspace and pane_id from TTY name."""
     try:
-        result = subprocess.run(
-            ["wezterm", "cli", "list", "--format", "json"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        panes = json.loads(result.stdout)
-
-        for pane in panes:
-            if pane.get("tty_name") == tty:
-                return pane.get("workspace"), pane.get("pane_id")
+        return _wezterm_panes_by_tty().get(tty, (None, None))
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, ValueError, KeyError):
+        return None, None
 
-    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError):
-        pass
 
-    return None, None
+# Channel prefixes whose agent runs as a process of the same name
+_AGENT_PROCESS_NAMES = frozenset({"claude", "codex", "openclaw", "opencode"})
 
 
 def _handle_tmux(metadata: dict[str, Any] | None) -> bool:
@@ -116,16 +120,8 @@ def _handle_tmux(metadata: dict[str, Any] | None) -> bool:
         cwd = metadata.get("cwd")
         if cwd:
             # Infer process name from channel prefix if available
-            channel = metadata.get("channel", "")
-            process_name = None
-            if channel.startswith("openclaw:"):
-                process_name = "openclaw"
-            elif channel.startswith("claude:"):
-                process_name = "claude"
-            elif channel.startswith("codex:"):
-                process_name = "codex"
-            elif channel.startswith("opencode:"):
-                process_name = "opencode"
+            prefix, sep, _ = metadata.get("channel", "").partition(":")
+            process_name = prefix if sep and prefix in _AGENT_PROCESS_NAMES else None
             session, pane_id = tmux.navigation.get_pane_for_cwd(cwd, process_name)
 
     if session is None or pane_id is None:
@@ -3,34 +3,52 @@
 import argparse
 import json
 import sys
-from dataclasses import asdict
+import time
 from datetime import datetime
 
 from . import db
 
 
 def _notification_to_json(n: db.Notification) -> dict:
-    """Convert notification to JSON-serializable dict."""
-    return asdict(n)
+    """Convert notification to JSON-serializable dict.
+
+    Same keys as dataclasses.asdict(), without its recursive deep copy.
+    """
+    return {
+        "id": n.id,
+        "channel": n.channel,
+        "message": n.message,
+        "name": n.name,
+        "metadata": n.metadata,
+        "status": n.status,
+        "created_at": n.created_at,
+        "read_at": n.read_at,
+        "switch_source": n.switch_source,
+    }
 
 
 def cmd_list(args: argparse.Namespace) -> None:
     """List unread notifications."""
-    with db.connect() as conn:
-        notifications = db.get_unread(conn)
-
     if getattr(args, "json", False):
-        print(json.dumps([_notification_to_json(n) for n in notifications]))
+        # SQLite assembles the JSON itself; no per-row Python objects needed
+        with db.connect() as conn:
+            print(db.get_unread_json(conn))
         return
 
+    with db.connect() as conn:
+        notifications = db.get_unread(conn)
+
     if not notifications:
         print("No unread notifications.")
         return
 
-    for n in notifications:
-        created = datetime.fromtimestamp(n.created_at).strftime("%H:%M:%S")
-        name_part = f" ({n.name})" if n.name else ""
-        print(f"[{n.id}] {created} | {n.channel}{name_part} | {n.message}")
+    strftime, localtime = time.strftime, time.localtime
+    lines = [
+        f"[{n.id}] {strftime('%H:%M:%S', localtime(n.created_at))}"
+        f" | {n.channel}{f' ({n.name})' if n.name else ''} | {n.message}"
+        for n in notifications
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_get(args: argparse.Namespace) -> None:
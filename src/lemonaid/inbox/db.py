@@ -1,16 +1,17 @@
 """SQLite database for lemonaid notifications."""
 
-import json
 import sqlite3
 import time
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Self
 
+from .. import fastjson
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Notification:
     """A notification in the lemonaid inbox."""
 
@@ -40,13 +41,29 @@ class Notification:
             channel=row["channel"],
             message=row["message"],
             name=name,
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            metadata=fastjson.loads(row["metadata"]) if row["metadata"] else {},
             status=row["status"],
             created_at=row["created_at"],
             read_at=row["read_at"],
             switch_source=switch_source,
         )
 
+    @classmethod
+    def from_tuple(cls, values: tuple[Any, ...]) -> Self:
+        """Create a Notification from a plain row of _COLUMNS."""
+        id, channel, message, name, metadata, status, created_at, read_at, switch_source = values
+        return cls(
+            id,
+            channel,
+            message,
+            name,
+            fastjson.loads(metadata) if metadata else {},
+            status,
+            created_at,
+            read_at,
+            switch_source,
+        )
+
     @property
     def is_read(self) -> bool:
         return self.status == "read"
@@ -90,50 +107,139 @@ def _init_schema(conn: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS idx_notifications_channel ON notifications(channel);
         CREATE INDEX IF NOT EXISTS idx_notifications_created ON notifications(created_at);
     """)
-    conn.commit()
 
 
-@contextmanager
-def connect(db_path: Path | None = None) -> Iterator[sqlite3.Connection]:
-    """Context manager for database connections."""
+def open_connection(db_path: Path | None = None) -> sqlite3.Connection:
+    """Open a database connection with the schema up to date.
+
+    The caller owns the connection and must close() it; prefer connect() for
+    short-lived use.
+    """
     from . import migrations
 
     if db_path is None:
         db_path = get_db_path()
 
-    conn = sqlite3.connect(db_path)
+    # Autocommit: single statements commit on their own; multi-statement
+    # writes use _transaction()
+    conn = sqlite3.connect(db_path, isolation_level=None)
     conn.row_factory = sqlite3.Row
-    _init_schema(conn)
+    # WAL lets hooks write while the TUI and watcher read, and with
+    # synchronous=NORMAL commits no longer fsync (durable as of the next checkpoint).
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    # Any migrated database already has the baseline schema, so only a fresh
+    # (or pre-migration) one needs it; run_migrations() is a no-op when current.
+    if migrations.get_current_version(conn) == 0:
+        _init_schema(conn)
     migrations.run_migrations(conn)
+    return conn
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run several statements as one write transaction, rolling back on error."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+def close(conn: sqlite3.Connection) -> None:
+    """Close a connection from open_connection().
+
+    Runs PRAGMA optimize first, as SQLite recommends, so the query planner gets
+    table statistics (e.g. to pick the partial unread index). It is usually a
+    no-op, and a busy database just skips it.
+    """
+    with suppress(sqlite3.Error):
+        conn.execute("PRAGMA optimize")
+    conn.close()
+
 
+@contextmanager
+def connect(db_path: Path | None = None) -> Iterator[sqlite3.Connection]:
+    """Context manager for database connections."""
+    conn = open_connection(db_path)
     try:
         yield conn
     finally:
-        conn.close()
+        close(conn)
 
 
 # --- Queries ---
 
+# Notification's fields in declaration order, for Notification.from_tuple
+_COLUMNS = "id, channel, message, name, metadata, status, created_at, read_at, switch_source"
+_N_COLUMNS = ", ".join(f"n.{col}" for col in _COLUMNS.split(", "))
+
+
+def _fetch_notifications(
+    conn: sqlite3.Connection, sql: str, params: tuple[Any, ...] = ()
+) -> list[Notification]:
+    """Run a query selecting _COLUMNS and build Notifications from plain tuples.
+
+    Plain tuples unpack faster than sqlite3.Row's name lookups.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return [Notification.from_tuple(row) for row in cursor.execute(sql, params)]
+
 
 def get(conn: sqlite3.Connection, notification_id: int) -> Notification | None:
     """Get a notification by ID."""
-    row = conn.execute(
-        "SELECT * FROM notifications WHERE id = ?",
-        (notification_id,),
-    ).fetchone()
-    return Notification.from_row(row) if row else None
+    found = _fetch_notifications(
+        conn, f"SELECT {_COLUMNS} FROM notifications WHERE id = ?", (notification_id,)
+    )
+    return found[0] if found else None
 
 
 def get_unread(conn: sqlite3.Connection) -> list[Notification]:
     """Get all unread notifications, newest first."""
-    rows = conn.execute(
-        """
-        SELECT * FROM notifications
+    return _fetch_notifications(
+        conn,
+        f"""
+        SELECT {_COLUMNS} FROM notifications
         WHERE status = 'unread'
         ORDER BY created_at DESC
+        """,
+    )
+
+
+def get_unread_json(conn: sqlite3.Connection) -> str:
+    """Get all unread notifications, newest first, as a JSON array built by SQLite.
+
+    Objects have the same keys as dataclasses.asdict(Notification). Timestamps
+    are printed with 17 significant digits because SQLite's own JSON number
+    formatting rounds them.
+    """
+    row = conn.execute(
         """
-    ).fetchall()
-    return [Notification.from_row(row) for row in rows]
+        SELECT json_group_array(json(obj)) FROM (
+            SELECT json_object(
+                'id', id,
+                'channel', channel,
+                'message', message,
+                'name', name,
+                'metadata', json(coalesce(nullif(metadata, ''), '{}')),
+                'status', status,
+                'created_at', json(printf('%!.17g', created_at)),
+                'read_at', CASE WHEN read_at IS NOT NULL
+                    THEN json(printf('%!.17g', read_at)) END,
+                'switch_source', switch_source
+            ) AS obj
+            FROM notifications
+            WHERE status = 'unread'
+            ORDER BY created_at DESC
+        )
+        """
+    ).fetchone()
+    return row[0]
 
 
 def get_active(conn: sqlite3.Connection, switch_source: str | None = None) -> list[Notification]:
@@ -143,9 +249,10 @@ def get_active(conn: sqlite3.Connection, switch_source: str | None = None) -> li
     If switch_source is provided, filters to only notifications with that exact source.
     """
     if switch_source:
-        rows = conn.execute(
-            """
-            SELECT n.* FROM notifications n
+        notifications = _fetch_notifications(
+            conn,
+            f"""
+            SELECT {_N_COLUMNS} FROM notifications n
             INNER JOIN (
                 SELECT channel, MAX(id) as max_id
                 FROM notifications
@@ -159,11 +266,12 @@ def get_active(conn: sqlite3.Connection, switch_source: str | None = None) -> li
                 n.created_at DESC
             """,
             (switch_source,),
-        ).fetchall()
+        )
     else:
-        rows = conn.execute(
-            """
-            SELECT n.* FROM notifications n
+        notifications = _fetch_notifications(
+            conn,
+            f"""
+            SELECT {_N_COLUMNS} FROM notifications n
             INNER JOIN (
                 SELECT channel, MAX(id) as max_id
                 FROM notifications
@@ -174,9 +282,50 @@ def get_active(conn: sqlite3.Connection, switch_source: str | None = None) -> li
             ORDER BY
                 CASE n.status WHEN 'unread' THEN 0 ELSE 1 END,
                 n.created_at DESC
-            """
-        ).fetchall()
-    return [Notification.from_row(row) for row in rows]
+            """,
+        )
+    return notifications
+
+
+def get_watch_targets(
+    conn: sqlite3.Connection,
+) -> list[tuple[str, str, str, float, bool, str | None, str, str | None]]:
+    """Get the active sessions the transcript watcher should follow.
+
+    Same rows as get_active(conn), but returns only what the watcher needs:
+    (channel, session_id, cwd, created_at, is_unread, tty, message, switch_source).
+    SQLite extracts the three metadata fields, so no metadata blob is decoded
+    in Python. Rows without a session_id and cwd are skipped.
+    """
+    rows = conn.execute(
+        """
+        SELECT
+            n.channel,
+            json_extract(nullif(n.metadata, ''), '$.session_id'),
+            json_extract(nullif(n.metadata, ''), '$.cwd'),
+            n.created_at,
+            n.status = 'unread',
+            json_extract(nullif(n.metadata, ''), '$.tty'),
+            n.message,
+            n.switch_source
+        FROM notifications n
+        INNER JOIN (
+            SELECT channel, MAX(id) as max_id
+            FROM notifications
+            WHERE status != 'archived'
+            GROUP BY channel
+        ) latest ON n.id = latest.max_id
+        WHERE n.status != 'archived'
+        ORDER BY
+            CASE n.status WHEN 'unread' THEN 0 ELSE 1 END,
+            n.created_at DESC
+        """
+    ).fetchall()
+    return [
+        (channel, session_id, cwd, created_at, bool(is_unread), tty, message, switch_source)
+        for channel, session_id, cwd, created_at, is_unread, tty, message, switch_source in rows
+        if session_id and cwd
+    ]
 
 
 def get_history(
@@ -191,9 +340,10 @@ def get_history(
     """
     if search:
         pattern = f"%{search}%"
-        rows = conn.execute(
-            """
-            SELECT n.* FROM notifications n
+        notifications = _fetch_notifications(
+            conn,
+            f"""
+            SELECT {_N_COLUMNS} FROM notifications n
             INNER JOIN (
                 SELECT channel, MAX(id) as max_id
                 FROM notifications
@@ -212,11 +362,12 @@ def get_history(
             LIMIT ?
             """,
             (pattern, pattern, pattern, pattern, pattern, limit),
-        ).fetchall()
+        )
     else:
-        rows = conn.execute(
-            """
-            SELECT n.* FROM notifications n
+        notifications = _fetch_notifications(
+            conn,
+            f"""
+            SELECT {_N_COLUMNS} FROM notifications n
             INNER JOIN (
                 SELECT channel, MAX(id) as max_id
                 FROM notifications
@@ -228,8 +379,23 @@ def get_history(
             LIMIT ?
             """,
             (limit,),
-        ).fetchall()
-    return [Notification.from_row(row) for row in rows]
+        )
+    return notifications
+
+
+# Fixed query text for each variant, rather than assembling it per call
+_GET_BY_CHANNEL_SQL = {
+    True: f"""
+        SELECT {_COLUMNS} FROM notifications
+        WHERE channel = ? AND status = 'unread'
+        ORDER BY created_at DESC LIMIT 1
+    """,
+    False: f"""
+        SELECT {_COLUMNS} FROM notifications
+        WHERE channel = ?
+        ORDER BY created_at DESC LIMIT 1
+    """,
+}
 
 
 def get_by_channel(
@@ -238,13 +404,8 @@ def get_by_channel(
     unread_only: bool = True,
 ) -> Notification | None:
     """Get the most recent notification for a channel."""
-    query = "SELECT * FROM notifications WHERE channel = ?"
-    if unread_only:
-        query += " AND status = 'unread'"
-    query += " ORDER BY created_at DESC LIMIT 1"
-
-    row = conn.execute(query, (channel,)).fetchone()
-    return Notification.from_row(row) if row else None
+    found = _fetch_notifications(conn, _GET_BY_CHANNEL_SQL[bool(unread_only)], (channel,))
+    return found[0] if found else None
 
 
 # --- Mutations ---
@@ -269,47 +430,67 @@ def add(
     now = created_at if created_at is not None else time.time()
     metadata = metadata or {}
 
-    if upsert:
-        # Look for any existing notification for this channel (including read/archived)
-        existing = get_by_channel(conn, channel, unread_only=False)
-        if existing:
-            # Preserve user-set name: if auto_name is in existing metadata,
-            # the user renamed this session — keep their name and carry forward auto_name.
-            if "auto_name" in existing.metadata:
-                metadata["auto_name"] = existing.metadata["auto_name"]
-                name = existing.name
-
-            conn.execute(
+    # The UPDATE and the INSERT fallback commit together, so a concurrent add()
+    # for the same channel can't slip in between
+    with _transaction(conn):
+        if upsert:
+            # Update the channel's latest notification (even if read or archived) in place.
+            # Preserve user-set name: if auto_name is in existing metadata, the user renamed
+            # this session — keep their name and carry forward auto_name.
+            row = conn.execute(
                 """
                 UPDATE notifications
-                SET message = ?, name = ?, metadata = ?, created_at = ?, status = 'unread', read_at = NULL, switch_source = ?
-                WHERE id = ?
+                SET message = :message,
+                    name = CASE WHEN json_type(nullif(metadata, ''), '$.auto_name') IS NULL
+                        THEN :name ELSE name END,
+                    metadata = CASE WHEN json_type(nullif(metadata, ''), '$.auto_name') IS NULL
+                        THEN :metadata
+                        ELSE json_set(:metadata, '$.auto_name', json_extract(metadata, '$.auto_name'))
+                        END,
+                    created_at = :now, status = 'unread', read_at = NULL,
+                    switch_source = :switch_source
+                WHERE id = (
+                    SELECT id FROM notifications WHERE channel = :channel
+                    ORDER BY created_at DESC LIMIT 1
+                )
+                RETURNING id, name, json_type(metadata, '$.auto_name'),
+                    json_extract(metadata, '$.auto_name')
                 """,
-                (message, name, json.dumps(metadata), now, switch_source, existing.id),
-            )
-            conn.commit()
-            return Notification(
-                id=existing.id,
-                channel=channel,
-                message=message,
-                name=name,
-                metadata=metadata,
-                status="unread",
-                created_at=now,
-                switch_source=switch_source,
-            )
-
-    cursor = conn.execute(
-        """
-        INSERT INTO notifications (channel, message, name, metadata, created_at, switch_source, status)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        (channel, message, name, json.dumps(metadata), now, switch_source, status),
-    )
-    conn.commit()
+                {
+                    "message": message,
+                    "name": name,
+                    "metadata": fastjson.dumps(metadata),
+                    "now": now,
+                    "switch_source": switch_source,
+                    "channel": channel,
+                },
+            ).fetchone()
+            if row:
+                notification_id, name, auto_name_type, auto_name = row
+                if auto_name_type is not None:
+                    metadata["auto_name"] = auto_name
+                return Notification(
+                    id=notification_id,
+                    channel=channel,
+                    message=message,
+                    name=name,
+                    metadata=metadata,
+                    status="unread",
+                    created_at=now,
+                    switch_source=switch_source,
+                )
+
+        (notification_id,) = conn.execute(
+            """
+            INSERT INTO notifications (channel, message, name, metadata, created_at, switch_source, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
+            """,
+            (channel, message, name, fastjson.dumps(metadata), now, switch_source, status),
+        ).fetchone()
 
     return Notification(
-        id=cursor.lastrowid or 0,
+        id=notification_id,
         channel=channel,
         message=message,
         name=name,
@@ -320,13 +501,44 @@ def add(
     )
 
 
-def mark_read(conn: sqlite3.Connection, notification_id: int) -> None:
-    """Mark a notification as read."""
-    conn.execute(
-        "UPDATE notifications SET status = 'read', read_at = ? WHERE id = ?",
+def add_many(
+    conn: sqlite3.Connection,
+    entries: Iterable[tuple[str, str, str | None, dict[str, Any], float, str | None, str]],
+) -> int:
+    """Insert many notifications in a single transaction, without upserting.
+
+    Each entry is (channel, message, name, metadata, created_at, switch_source, status).
+    Returns count of notifications inserted.
+    """
+    with _transaction(conn):
+        cursor = conn.executemany(
+            """
+            INSERT INTO notifications (channel, message, name, metadata, created_at, switch_source, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    channel,
+                    message,
+                    name,
+                    fastjson.dumps(metadata),
+                    created_at,
+                    switch_source,
+                    status,
+                )
+                for channel, message, name, metadata, created_at, switch_source, status in entries
+            ),
+        )
+    return cursor.rowcount
+
+
+def mark_read(conn: sqlite3.Connection, notification_id: int) -> str | None:
+    """Mark a notification as read. Returns its channel, or None if there is no such row."""
+    row = conn.execute(
+        "UPDATE notifications SET status = 'read', read_at = ? WHERE id = ? RETURNING channel",
         (time.time(), notification_id),
-    )
-    conn.commit()
+    ).fetchone()
+    return row[0] if row else None
 
 
 def mark_unread_for_channel(conn: sqlite3.Connection, channel: str) -> int:
@@ -346,7 +558,6 @@ def mark_unread_for_channel(conn: sqlite3.Connection, channel: str) -> int:
         """,
         (now, channel),
     )
-    conn.commit()
     return cursor.rowcount
 
 
@@ -384,28 +595,61 @@ def mark_all_read_for_channel(
             """,
             (now, channel),
         )
-    conn.commit()
     return cursor.rowcount
 
 
 def update_message(conn: sqlite3.Connection, channel: str, message: str) -> int:
     """Update the message for a channel without changing read/unread status.
 
-    Used for real-time activity updates while Claude is working.
-    Returns count of notifications updated.
+    Used for real-time activity updates while Claude is working. Rows that
+    already have this message are left alone. Returns count of notifications updated.
     """
     cursor = conn.execute(
         """
         UPDATE notifications
         SET message = ?
-        WHERE channel = ?
+        WHERE channel = ? AND message IS NOT ?
         """,
-        (message, channel),
+        (message, channel, message),
     )
-    conn.commit()
     return cursor.rowcount
 
 
+def apply_channel_updates(
+    conn: sqlite3.Connection,
+    updates: Iterable[tuple[str, str | None, bool]],
+) -> int:
+    """Apply a batch of watcher updates in a single transaction.
+
+    Each update is (channel, message, mark_read): mark_read marks the channel's
+    unread notifications as read, and a non-None message replaces the message
+    as update_message() does. Returns count of rows changed.
+    """
+    now = time.time()
+    count = 0
+    with _transaction(conn):
+        for channel, message, mark_read in updates:
+            if mark_read:
+                count += conn.execute(
+                    """
+                    UPDATE notifications
+                    SET status = 'read', read_at = ?
+                    WHERE channel = ? AND status = 'unread'
+                    """,
+                    (now, channel),
+                ).rowcount
+            if message is not None:
+                count += conn.execute(
+                    """
+                    UPDATE notifications
+                    SET message = ?
+                    WHERE channel = ? AND message IS NOT ?
+                    """,
+                    (message, channel, message),
+                ).rowcount
+    return count
+
+
 def update_name(
     conn: sqlite3.Connection,
     notification_id: int,
@@ -444,9 +688,8 @@ def update_name(
         SET name = ?, metadata = ?
         WHERE id = ?
         """,
-        (final_name, json.dumps(metadata), notification_id),
+        (final_name, fastjson.dumps(metadata), notification_id),
     )
-    conn.commit()
     return cursor.rowcount > 0
 
 
@@ -461,26 +704,19 @@ def mark_read_by_tty(conn: sqlite3.Connection, tty: str) -> int:
         """,
         (time.time(), tty),
     )
-    conn.commit()
     return cursor.rowcount
 
 
 def archive(conn: sqlite3.Connection, notification_id: int) -> None:
     """Archive a notification and all other rows sharing its channel."""
-    row = conn.execute(
-        "SELECT channel FROM notifications WHERE id = ?", (notification_id,)
-    ).fetchone()
-    if row:
-        conn.execute(
-            "UPDATE notifications SET status = 'archived' WHERE channel = ?",
-            (row["channel"],),
-        )
-    else:
-        conn.execute(
-            "UPDATE notifications SET status = 'archived' WHERE id = ?",
-            (notification_id,),
-        )
-    conn.commit()
+    conn.execute(
+        """
+        UPDATE notifications SET status = 'archived'
+        WHERE id = :id
+        OR channel = (SELECT channel FROM notifications WHERE id = :id)
+        """,
+        {"id": notification_id},
+    )
 
 
 def clear_old(conn: sqlite3.Connection, days: int = 7) -> int:
@@ -494,24 +730,4 @@ def clear_old(conn: sqlite3.Connection, days: int = 7) -> int:
         """,
         (cutoff, cutoff),
     )
-    conn.commit()
     return cursor.rowcount
-
-
-# --- Legacy aliases for existing code ---
-
-
-def add_notification(
-    channel: str,
-    message: str,
-    name: str | None = None,
-    metadata: dict[str, Any] | None = None,
-    conn: sqlite3.Connection | None = None,
-    upsert: bool = True,
-) -> int:
-    """Legacy wrapper - prefer using add() with connect() context manager."""
-    if conn is not None:
-        return add(conn, channel, message, name, metadata, upsert).id
-
-    with connect() as conn:
-        return add(conn, channel, message, name, metadata, upsert).id
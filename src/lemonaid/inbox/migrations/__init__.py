@@ -7,6 +7,7 @@ Each migration module should have:
 - migrate(conn) - function that performs the migration
 """
 
+import functools
 import importlib
 import pkgutil
 import sqlite3
@@ -23,8 +24,16 @@ def set_version(conn: sqlite3.Connection, version: int) -> None:
     conn.execute(f"PRAGMA user_version = {version}")
 
 
-def discover_migrations() -> list[tuple[int, str, Callable[[sqlite3.Connection], None]]]:
-    """Discover all migration modules and return sorted list of (version, description, migrate_fn)."""
+Migration = tuple[int, str, Callable[[sqlite3.Connection], None]]
+
+
+@functools.cache
+def discover_migrations() -> tuple[Migration, ...]:
+    """Discover all migration modules and return sorted (version, description, migrate_fn).
+
+    The set of migrations can't change while the process runs, so the package
+    is only scanned once.
+    """
     migrations = []
 
     # Import all modules in this package
@@ -39,7 +48,7 @@ def discover_migrations() -> list[tuple[int, str, Callable[[sqlite3.Connection],
 
     # Sort by version
     migrations.sort(key=lambda x: x[0])
-    return migrations
+    return tuple(migrations)
 
 
 def run_migrations(conn: sqlite3.Connection) -> list[str]:
@@ -49,12 +58,21 @@ def run_migrations(conn: sqlite3.Connection) -> list[str]:
     """
     current_version = get_current_version(conn)
     migrations = discover_migrations()
-    applied = []
+    applied: list[str] = []
+    # Already up to date: the common case on every connect()
+    if not migrations or current_version >= migrations[-1][0]:
+        return applied
 
     for version, description, migrate_fn in migrations:
         if version > current_version:
-            migrate_fn(conn)
-            set_version(conn, version)
+            # Each migration and its version bump apply together or not at all
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                migrate_fn(conn)
+                set_version(conn, version)
+            except BaseException:
+                conn.rollback()
+                raise
             conn.commit()
             applied.append(f"v{version}: {description}")
 
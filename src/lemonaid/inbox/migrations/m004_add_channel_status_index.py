@@ -0,0 +1,22 @@
+"""Add a (channel, status, id) index on notifications.
+
+get_active() finds the newest non-archived notification per channel. With
+status and id in the index, that aggregate is answered from the index alone
+instead of visiting every row. It also serves plain channel lookups, so the
+baseline idx_notifications_channel (a prefix of it) is dropped rather than
+maintained on every write.
+"""
+
+import sqlite3
+
+VERSION = 4
+DESCRIPTION = "Index notifications by (channel, status, id)"
+
+
+def migrate(conn: sqlite3.Connection) -> None:
+    """Create the covering index for the latest-per-channel lookup."""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notifications_channel_status_id "
+        "ON notifications(channel, status, id)"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_notifications_channel")
@@ -0,0 +1,21 @@
+"""Add a partial index over unread notifications, ordered by created_at.
+
+get_unread() (and `lemonaid inbox list`) want only unread rows, newest
+first. Most notifications are read or archived, so an index holding just the
+unread ones is small and already in the right order. SQLite only prefers it
+over the plain status index once it has table statistics, which db.close()
+gathers via PRAGMA optimize.
+"""
+
+import sqlite3
+
+VERSION = 5
+DESCRIPTION = "Index unread notifications by created_at"
+
+
+def migrate(conn: sqlite3.Connection) -> None:
+    """Create the partial index on unread notifications."""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notifications_unread_created "
+        "ON notifications(created_at DESC) WHERE status = 'unread'"
+    )
@@ -0,0 +1,20 @@
+"""Index unread notifications by the tty in their metadata.
+
+mark_read_by_tty() (the `lemonaid mark-read --tty` tmux binding) matches on
+json_extract(metadata, '$.tty'), which otherwise parses the metadata of every
+unread row. An index on that exact expression lets SQLite look the tty up
+instead; keeping it partial on unread rows keeps it small.
+"""
+
+import sqlite3
+
+VERSION = 6
+DESCRIPTION = "Index unread notifications by metadata tty"
+
+
+def migrate(conn: sqlite3.Connection) -> None:
+    """Create the partial expression index on unread notifications' tty."""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notifications_unread_tty "
+        "ON notifications(json_extract(metadata, '$.tty')) WHERE status = 'unread'"
+    )
@@ -0,0 +1,22 @@
+"""Add a partial index over non-archived notifications by (channel, id).
+
+get_active() runs on every TUI refresh and starts by finding the newest
+non-archived id per channel. The (channel, status, id) index answers that,
+but only by walking every row ever stored, archived history included. This
+index holds just the non-archived rows, so the walk scales with the active
+inbox rather than with history. As with the unread index, SQLite prefers it
+once db.close() has gathered statistics via PRAGMA optimize.
+"""
+
+import sqlite3
+
+VERSION = 7
+DESCRIPTION = "Index non-archived notifications by channel"
+
+
+def migrate(conn: sqlite3.Connection) -> None:
+    """Create the partial index on non-archived notifications."""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notifications_active_channel "
+        "ON notifications(channel, id) WHERE status != 'archived'"
+    )
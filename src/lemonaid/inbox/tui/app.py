@@ -1,25 +1,39 @@
 """Main Lemonaid TUI application."""
 
+import asyncio
 import contextlib
 import dataclasses
+import functools
 import os
 import shlex
+import sqlite3
 import subprocess
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import cast
+from typing import TypeVar, cast
 
+from rich.style import Style
 from rich.text import Text
 from textual import events
 from textual.app import App, ComposeResult
 from textual.binding import Binding
+from textual.coordinate import Coordinate
 from textual.widgets import DataTable, Footer, Header, Input, Static
 
 from ... import claude, codex, openclaw, opencode
-from ...claude.patcher import apply_patch, check_status, find_binary
+from ...claude.patcher import (
+    apply_patch,
+    cached_status,
+    check_status,
+    find_binary,
+    record_status,
+)
 from ...config import load_config
 from ...handlers import handle_notification
 from ...lemon_watchers import (
+    StopWatching,
     detect_terminal_switch_source,
     fish_path,
     start_unified_watcher,
@@ -31,26 +45,138 @@ from .screens import RenameScreen
 from .utils import set_terminal_title, styled_cell
 
 _DAY_SECONDS = 86400
+# How long after a keypress the refresh timer holds off
+_KEY_QUIET_SECONDS = 0.15
+
+_T = TypeVar("_T")
 
 
 _log = get_logger("tui")
 
 
-def _format_timestamp(ts: float) -> str:
+@functools.lru_cache(maxsize=4096)
+def _local_time_and_date(ts: int) -> tuple[str, str]:
+    """Format a whole-second timestamp as local (time, date)."""
     dt = datetime.fromtimestamp(ts)
-    if time.time() - ts < _DAY_SECONDS:
-        return dt.strftime("%H:%M:%S")
-    return dt.strftime("%Y-%m-%d")
+    return dt.strftime("%H:%M:%S"), dt.strftime("%Y-%m-%d")
+
+
+def _format_timestamp(ts: float) -> str:
+    # Only whole seconds are shown, so rows from the same second share a cache entry
+    clock, date = _local_time_and_date(int(ts))
+    return clock if time.time() - ts < _DAY_SECONDS else date
+
 
+# Channel prefixes of backends that support resume (a tuple, for one str.startswith() call)
+_RESUMABLE_PREFIXES = ("claude:", "codex:", "openclaw:", "opencode:")
 
-_RESUMABLE_BACKENDS = {"claude", "codex", "openclaw", "opencode"}
+
+# Sessions share a handful of cwds, and $HOME doesn't change while the app runs
+_fish_path = functools.lru_cache(maxsize=512)(fish_path)
 
 
 def _backend_label(channel: str, overrides: dict[str, str]) -> str:
-    prefix = channel.split(":")[0] if ":" in channel else channel
+    prefix = channel.partition(":")[0]
     return overrides.get(prefix, prefix)
 
 
+# Pre-parsed styles, so cells built per row don't hand Rich a style string to parse
+_DIM = Style.parse("dim")
+_DIM_CYAN = Style.parse("dim cyan")
+
+# Shared indicator cells (like styled_cell's, never modified)
+_UNREAD_INDICATOR = Text("●", style=Style.parse("bold cyan"))
+_OTHER_UNREAD_INDICATOR = Text("○", style=_DIM)
+_NO_INDICATOR = Text("")
+
+
+@functools.lru_cache(maxsize=1024)
+def _branch_cell(branch: str) -> Text:
+    """Dim cyan git branch cell for rows that aren't styled by read state (shared, never modified)."""
+    return Text(branch, style=_DIM_CYAN)
+
+
+# An inbox row: (row key, is_unread, plain cell values from LemonaidApp._row_values)
+_InboxRow = tuple[str, bool, tuple[str, ...]]
+
+
+def _main_cells(is_unread: bool, values: tuple[str, ...]) -> list[Text]:
+    """Styled cells for a switchable (main table) row."""
+    created, label, name, branch, cwd, message, tty = values
+    indicator = _UNREAD_INDICATOR if is_unread else _NO_INDICATOR
+    return [
+        styled_cell(created, is_unread),
+        indicator,
+        styled_cell(label, is_unread),
+        styled_cell(name, is_unread),
+        styled_cell(branch, is_unread),
+        styled_cell(cwd, is_unread),
+        styled_cell(message, is_unread),
+        styled_cell(tty, is_unread),
+    ]
+
+
+def _other_cells(is_unread: bool, values: tuple[str, ...]) -> list[Text]:
+    """Dim cells for a non-switchable row."""
+    created, label, name, branch, cwd, message, tty = values
+    indicator = _OTHER_UNREAD_INDICATOR if is_unread else _NO_INDICATOR
+    return [
+        styled_cell(created, False),
+        indicator,
+        styled_cell(label, False),
+        styled_cell(name, False),
+        _branch_cell(branch),
+        styled_cell(cwd, False),
+        styled_cell(message, False),
+        styled_cell(tty, False),
+    ]
+
+
+def _patch_rows(
+    table: DataTable,
+    old_rows: list[_InboxRow],
+    new_rows: list[_InboxRow],
+    cells: Callable[[bool, tuple[str, ...]], list[Text]],
+) -> bool:
+    """Update the table in place when its rows were only changed or removed.
+
+    Removed rows are dropped and changed cells rewritten. Returns False (without
+    touching the table) when rows were added or reordered; the caller rebuilds
+    the table then.
+    """
+    if len(old_rows) < len(new_rows):
+        return False
+    if len(old_rows) > len(new_rows):
+        # Removals (e.g. archiving) leave the remaining rows in their old order
+        new_keys = {key for key, _is_unread, _values in new_rows}
+        kept = [old for old in old_rows if old[0] in new_keys]
+        if len(kept) != len(new_rows):
+            return False
+    else:
+        kept = old_rows
+    if any(old[0] != new[0] for old, new in zip(kept, new_rows, strict=True)):
+        return False
+
+    if kept is not old_rows:
+        for key, _is_unread, _values in old_rows:
+            if key not in new_keys:
+                table.remove_row(key)
+
+    old_rows = kept
+    for row, (old, new) in enumerate(zip(old_rows, new_rows, strict=True)):
+        if old == new:
+            continue
+        _key, is_unread, values = new
+        # Cell 1 is the unread indicator; the rest map onto values in order
+        old_plain = (old[2][0], old[1], *old[2][1:])
+        new_plain = (values[0], is_unread, *values[1:])
+        for column, cell in enumerate(cells(is_unread, values)):
+            # Read/unread changes restyle the whole row
+            if old[1] != is_unread or old_plain[column] != new_plain[column]:
+                table.update_cell_at(Coordinate(row, column), cell)
+    return True
+
+
 def _build_resume_command(notification: db.Notification) -> tuple[str, list[str]] | None:
     """Build a (cwd, shell_command_string) for resuming a session.
 
@@ -186,7 +312,22 @@ class LemonaidApp(App):
         self._scratch_mode = scratch_mode
         self._history_mode = False
         self._history_filter = ""
+        # Backend label per channel; config isn't reloaded while the app runs
+        self._label_cache: dict[str, str] = {}
         self._exec_on_exit: tuple[str, list[str]] | None = None
+        self._conn: sqlite3.Connection | None = None
+        # Last rows drawn in the inbox tables and status line, to skip redundant redraws
+        self._inbox_rows: tuple[list, list] | None = None
+        # Timer ticks and the session watcher query on a dedicated thread with its own
+        # connection, so a busy database never stalls keypresses. Only that thread
+        # touches _worker_conn.
+        self._db_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lemonaid-db")
+        self._worker_conn: sqlite3.Connection | None = None
+        self._worker_closed = False
+        self._tick_pending = False
+        self._last_key_time = 0.0
+        self._refresh_fingerprint: tuple[int, int, int, int] | None = None
+        self._status_text: str | None = None
         # Enable ANSI colors for terminal transparency support
         if self.config.tui.transparent:
             self.ansi_color = True
@@ -244,14 +385,30 @@ class LemonaidApp(App):
             self.bind(up, "cursor_up", description="Up", show=False)
             self.bind(down, "cursor_down", description="Down", show=False)
 
+        # Where each action's bindings sit, for _set_binding_footer (in binding order)
+        self._binding_positions: dict[str, list[tuple[str, int]]] = {}
+        for key, bindings in self._bindings.key_to_bindings.items():
+            for i, binding in enumerate(bindings):
+                self._binding_positions.setdefault(binding.action, []).append((key, i))
+
     def compose(self) -> ComposeResult:
+        # Keep references to the widgets we update, rather than query_one() on every refresh
+        self._main_table: DataTable = DataTable(id="main_table")
+        self._other_label = Static("", id="other_sources_label")
+        self._other_table: DataTable = DataTable(id="other_sources_table", show_header=False)
+        self._history_filter_input = Input(
+            placeholder="Filter by name, cwd, branch...", id="history_filter"
+        )
+        self._history_table: DataTable = DataTable(id="history_table")
+        self._status = Static("", id="status")
+
         yield Header()
-        yield DataTable(id="main_table")
-        yield Static("", id="other_sources_label")
-        yield DataTable(id="other_sources_table", show_header=False)
-        yield Input(placeholder="Filter by name, cwd, branch...", id="history_filter")
-        yield DataTable(id="history_table")
-        yield Static("", id="status")
+        yield self._main_table
+        yield self._other_label
+        yield self._other_table
+        yield self._history_filter_input
+        yield self._history_table
+        yield self._status
         yield Footer()
 
     def on_mount(self) -> None:
@@ -261,25 +418,25 @@ class LemonaidApp(App):
         # Apply transparent styles if configured
         if self.config.tui.transparent:
             self.screen.styles.background = "transparent"
-            self.query_one("#main_table", DataTable).styles.background = "transparent"
-            self.query_one("#other_sources_table", DataTable).styles.background = "transparent"
-            self.query_one("#history_table", DataTable).styles.background = "transparent"
+            self._main_table.styles.background = "transparent"
+            self._other_table.styles.background = "transparent"
+            self._history_table.styles.background = "transparent"
 
-        self._setup_table(self.query_one("#main_table", DataTable))
-        other_table = self.query_one("#other_sources_table", DataTable)
+        self._setup_table(self._main_table)
+        other_table = self._other_table
         self._setup_table(other_table)
 
-        history_table = self.query_one("#history_table", DataTable)
+        history_table = self._history_table
         self._setup_table(history_table)
 
         # Hide other sources section and history initially
-        self.query_one("#other_sources_label", Static).display = False
+        self._other_label.display = False
         other_table.display = False
         history_table.display = False
-        self.query_one("#history_filter", Input).display = False
+        self._history_filter_input.display = False
 
         self._refresh_notifications()
-        self.set_interval(1.0, self._refresh_notifications)
+        self._refresh_timer = self.set_interval(1.0, self._maybe_refresh)
         # Start transcript watchers for auto-dismiss, message updates, and exit detection
         start_unified_watcher(
             backends=cast(
@@ -287,16 +444,34 @@ class LemonaidApp(App):
                 [claude.watcher, codex.watcher, openclaw.watcher, opencode.watcher],
             ),
             get_active=self._get_active_for_watcher,
-            mark_read=self._mark_channel_read,
-            update_message=self._update_channel_message,
             archive_channel=self._archive_channel,
             mark_unread=self._mark_channel_unread,
+            apply_updates=self._apply_watcher_updates,
         )
         self.call_later(self._check_claude_patch)
         self.call_later(self._stretch_all_tables)
         # Kick Footer to pick up dynamically-bound keys
         self.refresh_bindings()
 
+    def on_unmount(self) -> None:
+        if self._conn is not None:
+            db.close(self._conn)
+            self._conn = None
+        self._db_thread.submit(self._close_worker_conn)
+        self._db_thread.shutdown(wait=True)
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """The UI thread's database connection, opened on first use and kept open.
+
+        Refreshes run every second, so reopening (and re-checking the schema)
+        each time adds up. The watcher callbacks run on another thread and
+        open their own connections.
+        """
+        if self._conn is None:
+            self._conn = db.open_connection()
+        return self._conn
+
     def _check_claude_patch(self) -> None:
         """Check Claude Code patch status in a child process (avoids GIL stall).
 
@@ -309,6 +484,12 @@ class LemonaidApp(App):
             self._claude_patch_status = None
             return
 
+        # Skip the scan entirely if this exact binary was checked before
+        status = cached_status(self._claude_binary)
+        if status is not None:
+            self._set_patch_status(status)
+            return
+
         import threading
         from concurrent.futures import ProcessPoolExecutor
 
@@ -318,6 +499,7 @@ class LemonaidApp(App):
             try:
                 with ProcessPoolExecutor(max_workers=1) as pool:
                     status = pool.submit(check_status, binary).result(timeout=10)
+                record_status(binary, status)
             except Exception:
                 status = "unknown"
             self.call_from_thread(self._set_patch_status, status)
@@ -331,8 +513,18 @@ class LemonaidApp(App):
 
     def on_app_focus(self) -> None:
         """Refresh when the app regains focus."""
+        self._refresh_timer.resume()
         self._refresh_notifications()
 
+    def on_app_blur(self) -> None:
+        """Stop polling while a scratch pane is away (it's hidden until refocused).
+
+        A regular inbox keeps polling when unfocused: it may still be on
+        screen in a split next to the pane that has focus.
+        """
+        if self._scratch_mode:
+            self._refresh_timer.pause()
+
     def on_resize(self) -> None:
         self._stretch_all_tables()
 
@@ -344,9 +536,9 @@ class LemonaidApp(App):
         # (column_index, min_width, weight) — same layout for all tables
         # Name(3), Branch(4), CWD(5), Message(6) are flexible
         flex = [(3, 12, 0.10), (4, 12, 0.12), (5, 15, 0.15), (6, 25, 0.50)]
-        _stretch_columns(self.query_one("#main_table", DataTable), flex, w)
-        _stretch_columns(self.query_one("#other_sources_table", DataTable), flex, w)
-        _stretch_columns(self.query_one("#history_table", DataTable), flex, w)
+        _stretch_columns(self._main_table, flex, w)
+        _stretch_columns(self._other_table, flex, w)
+        _stretch_columns(self._history_table, flex, w)
 
     def _setup_table(self, table: DataTable) -> None:
         table.cursor_type = "row"
@@ -359,122 +551,203 @@ class LemonaidApp(App):
         table.add_column("Message", width=30)  # Stretched on resize
         table.add_column("TTY", width=10)
 
-    def _get_current_row_key(self) -> str | None:
-        """Get the row key (notification ID) at current cursor."""
-        table = self.query_one("#main_table", DataTable)
+    def _snapshot_cursor(self) -> tuple[str | None, int]:
+        """Get the main table's cursor as (row key / notification ID, row index)."""
+        table = self._main_table
+        coordinate = table.cursor_coordinate
         if table.row_count == 0:
-            return None
+            return None, coordinate.row
         try:
-            row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
-            return row_key.value if row_key else None
+            row_key, _ = table.coordinate_to_cell_key(coordinate)
         except Exception:
+            return None, coordinate.row
+        return row_key.value if row_key else None, coordinate.row
+
+    def _label(self, channel: str) -> str:
+        label = self._label_cache.get(channel)
+        if label is None:
+            label = _backend_label(channel, self.config.tui.backend_labels)
+            self._label_cache[channel] = label
+        return label
+
+    def _row_values(self, n: db.Notification) -> tuple[str, ...]:
+        """Plain-text cells for an inbox row (styling is applied when rendering)."""
+        tty = n.metadata.get("tty", "")
+        if tty:
+            tty = tty.replace("/dev/", "")
+        return (
+            _format_timestamp(n.created_at),
+            self._label(n.channel),
+            n.name or "",
+            n.metadata.get("git_branch", ""),
+            _fish_path(n.metadata.get("cwd", "")),
+            n.message,
+            tty,
+        )
+
+    async def _maybe_refresh(self) -> None:
+        """Timer tick: check for changes on the DB thread, then redraw if needed."""
+        # Let a burst of keypresses finish first; redrawing mid-burst only moves rows
+        # under the cursor, and each key's own refresh is already up to date
+        started = time.monotonic()
+        if self._tick_pending or started - self._last_key_time < _KEY_QUIET_SECONDS:
+            return
+        self._tick_pending = True
+        try:
+            inbox = await asyncio.get_running_loop().run_in_executor(
+                self._db_thread,
+                self._fetch_inbox_if_changed,
+                (self.size.height, int(time.time() // 60)),
+            )
+        finally:
+            self._tick_pending = False
+        if inbox is None:
+            return
+        if self._last_key_time >= started:
+            # A key (and maybe a write and its refresh) landed while querying, so these
+            # rows may be older than what's on screen: drop them and query next tick
+            self._refresh_fingerprint = None
+            return
+        self._show_inbox(*inbox)
+
+    def _fetch_inbox_if_changed(
+        self, view_key: tuple[int, int]
+    ) -> tuple[list[_InboxRow], list[_InboxRow]] | None:
+        """Query the inbox if something it shows may have changed (runs on the DB thread).
+
+        PRAGMA data_version changes whenever another connection (a hook, this
+        app's UI thread) commits, but not for this connection's own commits, so
+        the watcher's writes made here are tracked by total_changes. Terminal
+        height decides whether the lower table fits, and the minute lets rows
+        switch from time to date once they are a day old.
+        """
+        conn = self._worker_db()
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        fingerprint = (data_version, conn.total_changes, *view_key)
+        if fingerprint == self._refresh_fingerprint:
             return None
+        self._refresh_fingerprint = fingerprint
+        return self._query_inbox(conn)
+
+    def _worker_db(self) -> sqlite3.Connection:
+        """The DB thread's connection, opened on first use (call only on that thread)."""
+        if self._worker_closed:
+            # The app has unmounted; only watcher calls queued behind the close get here
+            raise StopWatching
+        if self._worker_conn is None:
+            self._worker_conn = db.open_connection()
+        return self._worker_conn
+
+    def _close_worker_conn(self) -> None:
+        self._worker_closed = True
+        if self._worker_conn is not None:
+            db.close(self._worker_conn)
+            self._worker_conn = None
+
+    def _run_on_db_thread(self, fn: Callable[[sqlite3.Connection], _T]) -> _T:
+        """Run fn with the DB thread's connection and wait for its result.
+
+        For the session watcher, which would otherwise open a connection per call.
+        Raises StopWatching once the app has unmounted, to end the watch loop.
+        """
+        try:
+            future = self._db_thread.submit(lambda: fn(self._worker_db()))
+        except RuntimeError:
+            # on_unmount has shut the DB thread down
+            raise StopWatching from None
+        return future.result()
 
-    def _get_current_row_index(self) -> int:
-        """Get the current cursor row index."""
-        table = self.query_one("#main_table", DataTable)
-        return table.cursor_coordinate.row
+    def _query_inbox(self, conn: sqlite3.Connection) -> tuple[list[_InboxRow], list[_InboxRow]]:
+        """Return rows for the (switchable, non-switchable) active notifications.
+
+        Rows are formatted here rather than in _show_inbox so that timer ticks do
+        that work on the DB thread too.
+        """
+        env_filter = self.current_env if self.current_env != "unknown" else None
+        # One query, split in order: the main table gets only sessions switchable from
+        # the current environment, the lower pane everything we can't switch to
+        current_notifications = []
+        other_notifications = []
+        for n in db.get_active(conn):
+            if env_filter and n.switch_source != env_filter:
+                other_notifications.append(n)
+            else:
+                current_notifications.append(n)
+        return (
+            [(str(n.id), n.is_unread, self._row_values(n)) for n in current_notifications],
+            [(str(n.id), n.is_unread, self._row_values(n)) for n in other_notifications],
+        )
 
     def _refresh_notifications(self, *, stay_on_unread: bool = False) -> None:
         # Don't refresh the active inbox while in history mode
+        if self._history_mode:
+            return
+        self._show_inbox(*self._query_inbox(self._db), stay_on_unread=stay_on_unread)
+
+    def _show_inbox(
+        self,
+        main_rows: list[_InboxRow],
+        other_rows: list[_InboxRow],
+        *,
+        stay_on_unread: bool = False,
+    ) -> None:
+        # A timer tick may land after switching to history mode
         if self._history_mode:
             return
 
-        main_table = self.query_one("#main_table", DataTable)
-        other_table = self.query_one("#other_sources_table", DataTable)
-        other_label = self.query_one("#other_sources_label", Static)
+        main_table = self._main_table
+        other_table = self._other_table
+        other_label = self._other_label
+
+        # Hide the non-switchable table if the terminal is too short — main table gets priority.
+        _MIN_MAIN_ROWS = 5
+        chrome = 4  # header + status + footer + other_label
+        other_height = min(len(other_rows), 8)
+        room_for_main = self.size.height - chrome - other_height
+        show_other = bool(other_rows) and room_for_main >= _MIN_MAIN_ROWS
+        if not show_other:
+            other_rows = []
+        unread_count = sum(1 for _key, is_unread, _values in main_rows if is_unread)
+        self._update_status(main_table_rows=len(main_rows), unread_count=unread_count)
+
+        # Most refreshes find nothing new; leave the tables (and cursors) alone then
+        rows = (main_rows, other_rows)
+        previous = self._inbox_rows
+        if rows == previous:
+            return
+        self._inbox_rows = rows
 
         # Remember current selection (both key and index) for both tables
-        current_key = self._get_current_row_key()
-        current_index = self._get_current_row_index()
+        current_key, current_index = self._snapshot_cursor()
         other_index = other_table.cursor_coordinate.row if other_table.row_count > 0 else 0
         focused_on_other = self.focused is other_table
 
-        main_table.clear()
-        other_table.clear()
-
-        with db.connect() as conn:
-            env_filter = self.current_env if self.current_env != "unknown" else None
-            # Main table: only sessions switchable from the current environment
-            current_notifications = db.get_active(conn, switch_source=env_filter)
-            # Lower pane: everything we can't switch to
-            if env_filter:
-                all_notifications = db.get_active(conn, switch_source=None)
-                other_notifications = [
-                    n for n in all_notifications if n.switch_source != env_filter
-                ]
+        # Same rows in the same order (e.g. only messages changed): patch cells in place
+        if (
+            previous is None
+            or other_table.display != show_other
+            or not _patch_rows(main_table, previous[0], main_rows, _main_cells)
+            or not _patch_rows(other_table, previous[1], other_rows, _other_cells)
+        ):
+            main_table.clear()
+            other_table.clear()
+
+            for key, is_unread, values in main_rows:
+                main_table.add_row(*_main_cells(is_unread, values), key=key)
+
+            # Populate non-switchable table (always dim, not interactive).
+            if show_other:
+                other_label.update("── non-switchable ──")
+                other_label.display = True
+                other_table.display = True
+
+                for key, is_unread, values in other_rows:
+                    other_table.add_row(*_other_cells(is_unread, values), key=key)
             else:
-                other_notifications = []
-
-        unread_count = 0
-
-        for n in current_notifications:
-            created = _format_timestamp(n.created_at)
-            tty = n.metadata.get("tty", "")
-            if tty:
-                tty = tty.replace("/dev/", "")
-
-            is_unread = n.is_unread
-            if is_unread:
-                unread_count += 1
-
-            indicator = Text("●", style="bold cyan") if is_unread else Text("")
-
-            cwd = fish_path(n.metadata.get("cwd", ""))
-            branch = n.metadata.get("git_branch", "")
-
-            main_table.add_row(
-                styled_cell(created, is_unread),
-                indicator,
-                styled_cell(_backend_label(n.channel, self.config.tui.backend_labels), is_unread),
-                styled_cell(n.name or "", is_unread),
-                styled_cell(branch, is_unread),
-                styled_cell(cwd, is_unread),
-                styled_cell(n.message, is_unread),
-                styled_cell(tty, is_unread),
-                key=str(n.id),
-            )
-
-        # Populate non-switchable table (always dim, not interactive).
-        # Hide it if the terminal is too short — main table gets priority.
-        _MIN_MAIN_ROWS = 5
-        chrome = 4  # header + status + footer + other_label
-        other_height = min(len(other_notifications), 8)
-        room_for_main = self.size.height - chrome - other_height
-        show_other = other_notifications and room_for_main >= _MIN_MAIN_ROWS
-
-        if show_other:
-            other_label.update("── non-switchable ──")
-            other_label.display = True
-            other_table.display = True
-
-            for n in other_notifications:
-                created = _format_timestamp(n.created_at)
-                tty = n.metadata.get("tty", "")
-                if tty:
-                    tty = tty.replace("/dev/", "")
-
-                indicator = Text("○", style="dim") if n.is_unread else Text("")
-
-                cwd = fish_path(n.metadata.get("cwd", ""))
-                branch = n.metadata.get("git_branch", "")
-
-                other_table.add_row(
-                    Text(created, style="dim"),
-                    indicator,
-                    Text(_backend_label(n.channel, self.config.tui.backend_labels), style="dim"),
-                    Text(n.name or "", style="dim"),
-                    Text(branch, style="dim cyan"),
-                    Text(cwd, style="dim"),
-                    Text(n.message, style="dim"),
-                    Text(tty, style="dim"),
-                    key=str(n.id),
-                )
-        else:
-            other_label.display = False
-            other_table.display = False
-            if focused_on_other:
-                self.query_one("#main_table", DataTable).focus()
+                other_label.display = False
+                other_table.display = False
+                if focused_on_other:
+                    self._main_table.focus()
 
         # Restore other table cursor
         if other_table.row_count > 0:
@@ -499,9 +772,8 @@ class LemonaidApp(App):
                     target_index = min(current_index, main_table.row_count - 1)
             main_table.move_cursor(row=target_index)
 
-        status = self.query_one("#status", Static)
-        displayed = main_table.row_count
-        read_count = displayed - unread_count
+    def _update_status(self, *, main_table_rows: int, unread_count: int) -> None:
+        read_count = main_table_rows - unread_count
         env_label = f" [{self.current_env}]" if self.current_env != "unknown" else ""
         status_text = f"{unread_count} unread, {read_count} read{env_label}"
 
@@ -509,7 +781,9 @@ class LemonaidApp(App):
         if self._claude_patch_status == "unpatched":
             status_text += "  |  [bold cyan]P[/]atch Claude for faster notifications"
 
-        status.update(status_text)
+        if status_text != self._status_text:
+            self._status_text = status_text
+            self._status.update(status_text)
 
     def action_quit(self) -> None:
         """Quit the app, or just hide the pane in scratch mode.
@@ -528,32 +802,27 @@ class LemonaidApp(App):
         self, action: str, *, show: bool | None = None, label: str | None = None
     ) -> None:
         """Toggle visibility or label of the primary binding for an action."""
-        found = False
-        for key, bindings in self._bindings.key_to_bindings.items():
-            for i, binding in enumerate(bindings):
-                if binding.action != action:
-                    continue
-
-                replacements: dict = {}
-                if not found and show is not None:
-                    replacements["show"] = show
-                if label is not None:
-                    replacements["description"] = label
-                if replacements:
-                    self._bindings.key_to_bindings[key][i] = dataclasses.replace(
-                        binding, **replacements
-                    )
-                found = True
+        key_to_bindings = self._bindings.key_to_bindings
+        for n, (key, i) in enumerate(self._binding_positions.get(action, ())):
+            replacements: dict = {}
+            if n == 0 and show is not None:
+                replacements["show"] = show
+            if label is not None:
+                replacements["description"] = label
+            if replacements:
+                key_to_bindings[key][i] = dataclasses.replace(
+                    key_to_bindings[key][i], **replacements
+                )
 
     def _set_history_mode(self, enabled: bool) -> None:
         self._history_mode = enabled
         self._history_filter = ""
 
-        main_table = self.query_one("#main_table", DataTable)
-        other_label = self.query_one("#other_sources_label", Static)
-        other_table = self.query_one("#other_sources_table", DataTable)
-        history_table = self.query_one("#history_table", DataTable)
-        history_filter = self.query_one("#history_filter", Input)
+        main_table = self._main_table
+        other_label = self._other_label
+        other_table = self._other_table
+        history_table = self._history_table
+        history_filter = self._history_filter_input
 
         # Inbox-only actions
         for action in ("jump_unread", "mark_read", "archive", "rename"):
@@ -589,49 +858,51 @@ class LemonaidApp(App):
             main_table.display = True
             history_table.display = False
             history_filter.display = False
+            # History mode hid the lower table and rewrote the status line; redraw both
+            self._inbox_rows = None
+            self._status_text = None
             self._refresh_notifications()
             main_table.focus()
 
     def _refresh_history(self) -> None:
-        history_table = self.query_one("#history_table", DataTable)
+        history_table = self._history_table
         current_row = history_table.cursor_coordinate.row if history_table.row_count > 0 else 0
 
         history_table.clear()
 
-        with db.connect() as conn:
-            notifications = db.get_history(conn, search=self._history_filter)
+        notifications = db.get_history(self._db, search=self._history_filter)
 
         for n in notifications:
             # Only show sessions from backends that support resume
-            if not any(n.channel.startswith(f"{b}:") for b in _RESUMABLE_BACKENDS):
+            if not n.channel.startswith(_RESUMABLE_PREFIXES):
                 continue
 
             created = _format_timestamp(n.created_at)
-            cwd = fish_path(n.metadata.get("cwd", ""))
+            cwd = _fish_path(n.metadata.get("cwd", ""))
             branch = n.metadata.get("git_branch", "")
 
             history_table.add_row(
-                Text(created, style="dim"),
-                Text(""),  # No unread indicator for archived
-                Text(_backend_label(n.channel, self.config.tui.backend_labels), style="dim"),
-                Text(n.name or "", style=""),
-                Text(branch, style="dim cyan"),
-                Text(cwd, style="dim"),
-                Text(n.message, style="dim"),
-                Text("", style="dim"),  # No TTY for archived
+                styled_cell(created, False),
+                _NO_INDICATOR,  # No unread indicator for archived
+                styled_cell(self._label(n.channel), False),
+                Text(n.name or ""),
+                _branch_cell(branch),
+                styled_cell(cwd, False),
+                Text(n.message, style=_DIM),
+                styled_cell("", False),  # No TTY for archived
                 key=str(n.id),
             )
 
         if history_table.row_count > 0:
             history_table.move_cursor(row=min(current_row, history_table.row_count - 1))
 
-        status = self.query_one("#status", Static)
+        status = self._status
         count = history_table.row_count
         status.update(f"{count} archived session{'s' if count != 1 else ''}")
 
     def _resume_session(self, *, copy_only: bool = False) -> None:
         """Resume the selected history session."""
-        history_table = self.query_one("#history_table", DataTable)
+        history_table = self._history_table
         if history_table.row_count == 0:
             return
 
@@ -640,8 +911,7 @@ class LemonaidApp(App):
             return
 
         notification_id = int(row_key.value)
-        with db.connect() as conn:
-            notification = db.get(conn, notification_id)
+        notification = db.get(self._db, notification_id)
 
         if not notification:
             return
@@ -662,12 +932,10 @@ class LemonaidApp(App):
         _log.info("resume: %s (%s) -> %s", notification.channel, mode, cmd_str)
 
         # Unarchive so the session appears in the main inbox immediately
-        with db.connect() as conn:
-            conn.execute(
-                "UPDATE notifications SET status = 'unread', read_at = NULL, created_at = ? WHERE id = ?",
-                (time.time(), notification.id),
-            )
-            conn.commit()
+        self._db.execute(
+            "UPDATE notifications SET status = 'unread', read_at = NULL, created_at = ? WHERE id = ?",
+            (time.time(), notification.id),
+        )
 
         # Non-scratch, non-copy: exec in the current terminal
         if not copy_only and not self._scratch_mode and argv:
@@ -696,7 +964,7 @@ class LemonaidApp(App):
         if not self._history_mode:
             return
 
-        history_table = self.query_one("#history_table", DataTable)
+        history_table = self._history_table
         if history_table.row_count == 0:
             return
 
@@ -705,8 +973,7 @@ class LemonaidApp(App):
             return
 
         notification_id = int(row_key.value)
-        with db.connect() as conn:
-            notification = db.get(conn, notification_id)
+        notification = db.get(self._db, notification_id)
 
         if not notification:
             return
@@ -719,12 +986,10 @@ class LemonaidApp(App):
         cwd, argv = resume
 
         # Unarchive so the session appears in the inbox once it starts
-        with db.connect() as conn:
-            conn.execute(
-                "UPDATE notifications SET status = 'unread', read_at = NULL, created_at = ? WHERE id = ?",
-                (time.time(), notification.id),
-            )
-            conn.commit()
+        self._db.execute(
+            "UPDATE notifications SET status = 'unread', read_at = NULL, created_at = ? WHERE id = ?",
+            (time.time(), notification.id),
+        )
 
         error = spawn_session_for_resume(
             resume_argv=argv,
@@ -740,7 +1005,7 @@ class LemonaidApp(App):
         """Show the filter input in history mode."""
         if not self._history_mode:
             return
-        history_filter = self.query_one("#history_filter", Input)
+        history_filter = self._history_filter_input
         history_filter.display = True
         history_filter.focus()
 
@@ -751,6 +1016,7 @@ class LemonaidApp(App):
 
     def on_key(self, event: events.Key) -> None:
         """Handle special keys in the filter input."""
+        self._last_key_time = time.monotonic()
         if not (isinstance(self.focused, Input) and self.focused.id == "history_filter"):
             return
 
@@ -758,7 +1024,7 @@ class LemonaidApp(App):
         if event.key in ("down", "enter"):
             event.prevent_default()
             event.stop()
-            self.query_one("#history_table", DataTable).focus()
+            self._history_table.focus()
             return
 
         # Escape: clear filter, hide it, focus table
@@ -766,23 +1032,23 @@ class LemonaidApp(App):
             event.prevent_default()
             event.stop()
             self._history_filter = ""
-            history_filter = self.query_one("#history_filter", Input)
+            history_filter = self._history_filter_input
             history_filter.value = ""
             history_filter.display = False
             self._refresh_history()
-            self.query_one("#history_table", DataTable).focus()
+            self._history_table.focus()
 
     def _focused_table(self) -> DataTable:
         focused = self.focused
         if isinstance(focused, DataTable):
             return focused
-        return self.query_one("#main_table", DataTable)
+        return self._main_table
 
     def action_cursor_up(self) -> None:
         """Move cursor up, jumping to main table from other table when at top."""
         table = self._focused_table()
         if table.id == "other_sources_table" and table.cursor_coordinate.row == 0:
-            main = self.query_one("#main_table", DataTable)
+            main = self._main_table
             main.focus()
             if main.row_count > 0:
                 main.move_cursor(row=main.row_count - 1)
@@ -793,7 +1059,7 @@ class LemonaidApp(App):
         """Move cursor down, jumping to other table from main table when at bottom."""
         table = self._focused_table()
         if table.id == "main_table" and table.cursor_coordinate.row >= table.row_count - 1:
-            other = self.query_one("#other_sources_table", DataTable)
+            other = self._other_table
             if other.display and other.row_count > 0:
                 other.focus()
                 other.move_cursor(row=0)
@@ -820,11 +1086,9 @@ class LemonaidApp(App):
         row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
         if row_key:
             notification_id = int(row_key.value)
-            with db.connect() as conn:
-                n = db.get(conn, notification_id)
-                db.mark_read(conn, notification_id)
-            if n:
-                _log.info("mark_read: %s", n.channel)
+            channel = db.mark_read(self._db, notification_id)
+            if channel:
+                _log.info("mark_read: %s", channel)
             # Keep cursor on unread items when possible
             self._refresh_notifications(stay_on_unread=True)
 
@@ -837,23 +1101,21 @@ class LemonaidApp(App):
         row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
         if row_key:
             notification_id = int(row_key.value)
-            with db.connect() as conn:
-                db.archive(conn, notification_id)
+            db.archive(self._db, notification_id)
             self._refresh_notifications()
 
     def action_rename(self) -> None:
         """Rename the selected session."""
-        table = self.query_one("#main_table", DataTable)
+        table = self._main_table
         if table.row_count == 0:
             return
 
-        row_key = self._get_current_row_key()
+        row_key, _ = self._snapshot_cursor()
         if not row_key:
             return
 
         notification_id = int(row_key)
-        with db.connect() as conn:
-            notification = db.get(conn, notification_id)
+        notification = db.get(self._db, notification_id)
 
         if not notification:
             return
@@ -864,8 +1126,7 @@ class LemonaidApp(App):
                 return
             # Empty string means clear override, otherwise set the name
             name_to_set = new_name.strip() if new_name.strip() else None
-            with db.connect() as conn:
-                db.update_name(conn, notification_id, name_to_set)
+            db.update_name(self._db, notification_id, name_to_set)
             self._refresh_notifications()
 
         self.push_screen(
@@ -875,9 +1136,8 @@ class LemonaidApp(App):
 
     def action_jump_unread(self) -> None:
         """Jump directly to the earliest unread session."""
-        with db.connect() as conn:
-            env_filter = self.current_env if self.current_env != "unknown" else None
-            notifications = db.get_active(conn, switch_source=env_filter)
+        env_filter = self.current_env if self.current_env != "unknown" else None
+        notifications = db.get_active(self._db, switch_source=env_filter)
 
         # Find the earliest (oldest) unread - they're sorted newest first
         unread = [n for n in notifications if n.is_unread]
@@ -887,7 +1147,7 @@ class LemonaidApp(App):
 
         # Move cursor to earliest unread row, then select it (same path as Enter)
         earliest_row = len(unread) - 1
-        table = self.query_one("#main_table", DataTable)
+        table = self._main_table
         table.move_cursor(row=earliest_row)
         table.action_select_cursor()
 
@@ -900,6 +1160,7 @@ class LemonaidApp(App):
             count = apply_patch(self._claude_binary)
             if count > 0:
                 self._claude_patch_status = "patched"
+                record_status(self._claude_binary, "patched")
                 self.notify(f"Patched Claude Code ({count} locations). Restart Claude for effect.")
             else:
                 self.notify("No patterns found to patch", severity="warning")
@@ -927,52 +1188,48 @@ class LemonaidApp(App):
 
         Returns list of (channel, session_id, cwd, created_at, is_unread, tty, message, switch_source).
         """
-        with db.connect() as conn:
-            notifications = db.get_active(conn, switch_source=None)
+        return self._run_on_db_thread(db.get_watch_targets)
 
-        result = []
-        for n in notifications:
-            session_id = n.metadata.get("session_id")
-            cwd = n.metadata.get("cwd")
-            tty = n.metadata.get("tty")
-            if session_id and cwd:
-                result.append(
-                    (
-                        n.channel,
-                        session_id,
-                        cwd,
-                        n.created_at,
-                        n.is_unread,
-                        tty,
-                        n.message,
-                        n.switch_source,
-                    )
-                )
-        return result
+    def _watcher_write(self, fn: Callable[[sqlite3.Connection], int]) -> int:
+        """Run a watcher write on the DB thread, then redraw right away if it changed rows.
+
+        Without this the change would only show on the next timer tick.
+        """
+
+        def write(conn: sqlite3.Connection) -> int:
+            count = fn(conn)
+            if count:
+                # Force the next check to query (set here, where the tick reads it)
+                self._refresh_fingerprint = None
+            return count
 
-    def _mark_channel_read(self, channel: str) -> int:
-        """Mark all notifications for a channel as read."""
-        with db.connect() as conn:
-            return db.mark_all_read_for_channel(conn, channel)
+        count = self._run_on_db_thread(write)
+        if count:
+            try:
+                self.call_from_thread(self.call_later, self._maybe_refresh)
+            except RuntimeError:
+                # The app is no longer running
+                raise StopWatching from None
+        return count
 
     def _mark_channel_unread(self, channel: str) -> int:
         """Mark all notifications for a channel as unread (needs attention)."""
-        with db.connect() as conn:
-            return db.mark_unread_for_channel(conn, channel)
+        return self._watcher_write(lambda conn: db.mark_unread_for_channel(conn, channel))
 
-    def _update_channel_message(self, channel: str, message: str) -> int:
-        """Update the message for a channel."""
-        with db.connect() as conn:
-            return db.update_message(conn, channel, message)
+    def _apply_watcher_updates(self, updates: list[tuple[str, str | None, bool]]) -> int:
+        """Write a watcher pass's read/message updates in one transaction."""
+        return self._watcher_write(lambda conn: db.apply_channel_updates(conn, updates))
 
     def _archive_channel(self, channel: str) -> None:
         """Archive all notifications for a channel (session exited)."""
-        with db.connect() as conn:
-            conn.execute(
-                "UPDATE notifications SET status = 'archived' WHERE channel = ?",
-                (channel,),
+        self._watcher_write(
+            lambda conn: (
+                conn.execute(
+                    "UPDATE notifications SET status = 'archived' WHERE channel = ?",
+                    (channel,),
+                ).rowcount
             )
-            conn.commit()
+        )
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle Enter on a row.
@@ -991,19 +1248,18 @@ class LemonaidApp(App):
 
         notification_id = int(event.row_key.value)
 
-        with db.connect() as conn:
-            notification = db.get(conn, notification_id)
-            if notification:
-                # Include channel in metadata for cwd-based fallback resolution
-                metadata = {**notification.metadata, "channel": notification.channel}
-                handle_notification(
-                    metadata,
-                    self.config,
-                    switch_source=notification.switch_source,
-                )
-                # In scratch/auto-dismiss mode, hide the pane after navigation
-                if self._scratch_mode:
-                    self._hide_scratch_pane()
+        notification = db.get(self._db, notification_id)
+        if notification:
+            # Include channel in metadata for cwd-based fallback resolution
+            metadata = {**notification.metadata, "channel": notification.channel}
+            handle_notification(
+                metadata,
+                self.config,
+                switch_source=notification.switch_source,
+            )
+            # In scratch/auto-dismiss mode, hide the pane after navigation
+            if self._scratch_mode:
+                self._hide_scratch_pane()
 
 
 def main() -> None:
@@ -1,20 +1,30 @@
 """TUI utilities and helpers."""
 
+import functools
 import sys
 
+from rich.style import Style
 from rich.text import Text
 
+_UNREAD_STYLE = Style.parse("bold cyan")
+_READ_STYLE = Style.parse("dim")
+
 
 def set_terminal_title(title: str) -> None:
     """Set the terminal/pane title via OSC escape sequence."""
-    # OSC 0 sets both icon name and window title
-    sys.stdout.write(f"\033]0;{title}\007")
-    sys.stdout.flush()
+    # OSC 0 sets both icon name and window title; written as bytes in one write,
+    # skipping the text layer's encoding
+    sys.stdout.buffer.write(f"\033]0;{title}\007".encode())
+    sys.stdout.buffer.flush()
 
 
+@functools.lru_cache(maxsize=4096)
 def styled_cell(value: str, is_unread: bool) -> Text:
-    """Style a cell value based on read/unread status."""
+    """Style a cell value based on read/unread status.
+
+    Cells are cached and shared between rows and refreshes, so don't modify them.
+    """
     if is_unread:
-        return Text(value, style="bold cyan")
+        return Text(value, style=_UNREAD_STYLE)
 
-    return Text(value, style="dim")
+    return Text(value, style=_READ_STYLE)
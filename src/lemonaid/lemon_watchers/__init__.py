@@ -2,15 +2,18 @@
 
 from .common import (
     detect_terminal_switch_source,
+    first_line,
     fish_path,
     get_git_branch,
     get_name_from_cwd,
     get_tmux_session_name,
     get_tty,
+    lines_reverse,
     short_filename,
     shorten_path,
 )
 from .watcher import (
+    StopWatching,
     WatcherBackend,
     get_latest_activity,
     has_activity_since,
@@ -20,8 +23,10 @@ from .watcher import (
 )
 
 __all__ = [
+    "StopWatching",
     "WatcherBackend",
     "detect_terminal_switch_source",
+    "first_line",
     "fish_path",
     "get_latest_activity",
     "get_git_branch",
@@ -29,6 +34,7 @@ __all__ = [
     "get_tmux_session_name",
     "get_tty",
     "has_activity_since",
+    "lines_reverse",
     "parse_timestamp",
     "read_jsonl_tail",
     "short_filename",
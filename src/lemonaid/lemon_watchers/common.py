@@ -3,8 +3,12 @@
 import os
 import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+# Resolved once: shorten_path runs for every row the TUI and hooks render.
+_HOME_PREFIX = str(Path.home()) + "/"
+
 
 def get_tty() -> str | None:
     """Get the TTY name for this process or an ancestor process.
@@ -122,17 +126,15 @@ def shorten_path(path: str) -> str:
     """
     if not path:
         return "session"
-    cwd_path = Path(path)
-    home = Path.home()
-
-    if cwd_path.is_relative_to(home):
-        display_path = "~/" + str(cwd_path.relative_to(home))
-    else:
-        display_path = str(cwd_path)
+    display_path = path.rstrip("/") or "/"
+    if display_path.startswith(_HOME_PREFIX):
+        display_path = "~/" + display_path[len(_HOME_PREFIX) :]
+    elif display_path == _HOME_PREFIX[:-1]:
+        return "~"
 
-    parts = display_path.split("/")
+    parts = display_path.rsplit("/", 2)
     if len(parts) > 2:
-        return "/".join(parts[-2:])
+        return parts[1] + "/" + parts[2]
     return display_path
 
 
@@ -202,6 +204,34 @@ def get_git_branch(cwd: str) -> str | None:
         return None
 
 
+def first_line(text: str, limit: int = 200) -> str | None:
+    """First line of the stripped text, truncated to `limit` chars with "...".
+
+    Returns None for empty/whitespace-only text.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return None
+    nl = stripped.find("\n")
+    line = stripped if nl == -1 else stripped[:nl]
+    return line[:limit] + ("..." if len(line) > limit else "")
+
+
+def lines_reverse(text: str) -> Iterator[str]:
+    """Yield the non-blank lines of text, last first.
+
+    Walks backwards with rfind instead of splitting the whole buffer, so a
+    caller looking for the most recent matching line only slices what it reads.
+    """
+    end = len(text)
+    while end > 0:
+        start = text.rfind("\n", 0, end) + 1
+        line = text[start:end]
+        if line and not line.isspace():
+            yield line
+        end = start - 1
+
+
 def short_filename(path: str) -> str:
     """Shorten a file path for display - just the filename."""
     if not path:
@@ -0,0 +1,154 @@
+"""Block until watched session files change, instead of sleeping blindly.
+
+The watch loop re-reads every active transcript on each pass. Most of the
+time nothing has been appended, so rather than waking on a fixed short
+interval we ask the kernel to wake us when one of the files is written:
+kqueue on macOS/BSD, inotify on Linux (via libc, no extra dependency).
+Anywhere else, or if setup fails, waiting degrades to a plain sleep.
+"""
+
+import ctypes
+import os
+import select
+import struct
+import sys
+import time
+import typing as ty
+from collections.abc import Collection
+from pathlib import Path
+
+from ..log import get_logger
+
+_log = get_logger("watcher.filewait")
+
+
+class FileWaiter(ty.Protocol):
+    def wait(self, paths: Collection[Path], timeout: float) -> bool:
+        """Wait until one of paths changes or timeout elapses.
+
+        Returns True if woken by a change, False on timeout.
+        """
+        ...
+
+
+class _SleepWaiter:
+    """Fallback: no change notifications, just wait out the timeout."""
+
+    def wait(self, paths: Collection[Path], timeout: float) -> bool:
+        time.sleep(timeout)
+        return False
+
+
+class _KqueueWaiter:
+    """macOS/BSD: one EVFILT_VNODE registration per open file descriptor."""
+
+    _FFLAGS = (
+        select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND | select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME
+        if hasattr(select, "kqueue")
+        else 0
+    )
+    # O_EVTONLY watches without keeping the volume busy; macOS only.
+    _OPEN_FLAGS = getattr(os, "O_EVTONLY", os.O_RDONLY)
+
+    def __init__(self) -> None:
+        self._kq = select.kqueue()
+        self._fds: dict[str, int] = {}
+
+    def _sync(self, paths: Collection[Path]) -> None:
+        wanted = {str(p) for p in paths}
+        for path in self._fds.keys() - wanted:
+            os.close(self._fds.pop(path))  # closing the fd drops its kevent
+        for path in wanted - self._fds.keys():
+            try:
+                fd = os.open(path, self._OPEN_FLAGS)
+            except OSError:
+                continue
+            event = select.kevent(
+                fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=self._FFLAGS,
+            )
+            self._kq.control([event], 0, 0)
+            self._fds[path] = fd
+
+    def wait(self, paths: Collection[Path], timeout: float) -> bool:
+        self._sync(paths)
+        events = self._kq.control(None, 64, timeout)
+        gone = {
+            ev.ident for ev in events if ev.fflags & (select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME)
+        }
+        if gone:
+            # Re-open on the next wait, in case the path now names a new file.
+            for path, fd in list(self._fds.items()):
+                if fd in gone:
+                    os.close(self._fds.pop(path))
+        return bool(events)
+
+
+class _InotifyWaiter:
+    """Linux: a single inotify instance with one watch per file."""
+
+    _IN_MODIFY = 0x002
+    _IN_MOVE_SELF = 0x800
+    _IN_DELETE_SELF = 0x400
+    _IN_IGNORED = 0x8000
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._watches: dict[str, int] = {}
+
+    def _sync(self, paths: Collection[Path]) -> None:
+        wanted = {str(p) for p in paths}
+        for path in self._watches.keys() - wanted:
+            self._rm_watch(self._fd, self._watches.pop(path))
+        mask = self._IN_MODIFY | self._IN_MOVE_SELF | self._IN_DELETE_SELF
+        for path in wanted - self._watches.keys():
+            wd = self._add_watch(self._fd, os.fsencode(path), mask)
+            if wd >= 0:
+                self._watches[path] = wd
+
+    def _drain(self) -> None:
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        dropped: set[int] = set()
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _cookie, name_len = self._EVENT_HEADER.unpack_from(buf, offset)
+            if mask & self._IN_IGNORED:
+                dropped.add(wd)
+            offset += self._EVENT_HEADER.size + name_len
+        if dropped:
+            # The kernel removed these watches (file deleted/moved); forget
+            # them so the next wait re-adds whatever the path now points to.
+            self._watches = {p: wd for p, wd in self._watches.items() if wd not in dropped}
+
+    def wait(self, paths: Collection[Path], timeout: float) -> bool:
+        self._sync(paths)
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if ready:
+            self._drain()
+        return bool(ready)
+
+
+def make_file_waiter() -> FileWaiter:
+    """Return the best available FileWaiter for this platform."""
+    try:
+        if hasattr(select, "kqueue"):
+            return _KqueueWaiter()
+        if sys.platform.startswith("linux"):
+            return _InotifyWaiter()
+    except (OSError, AttributeError) as e:
+        _log.warning("file change notifications unavailable, polling instead: %s", e)
+    return _SleepWaiter()
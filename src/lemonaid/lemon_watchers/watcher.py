@@ -4,16 +4,22 @@ Provides shared watcher loop logic that can be used by multiple backends
 (Claude, Codex, etc.) to monitor session files for activity.
 """
 
-import json
+import functools
+import itertools
+import os
+import re
 import subprocess
 import threading
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Protocol
 
+from .. import fastjson
 from ..log import get_logger
+from .filewait import make_file_waiter
 
 _log = get_logger("watcher")
 
@@ -73,12 +79,158 @@ def read_jsonl_tail(path: Path, max_bytes: int = 64 * 1024) -> list[str]:
         return []
 
 
+def _iter_lines_reverse(
+    path: Path, max_bytes: int = 64 * 1024, chunk_size: int = 8192
+) -> Iterator[bytes]:
+    """Yield the non-blank lines in the last max_bytes of a file, newest first.
+
+    Reads backwards one chunk at a time, so a caller that stops at the first
+    interesting entry only touches the end of the file. Like read_jsonl_tail,
+    the first (possibly partial) line of a truncated window is skipped.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        pos = os.fstat(fd).st_size
+        floor = max(0, pos - max_bytes)
+        pending = b""  # start of the earliest line seen so far; may continue further back
+        while pos > floor:
+            read_size = min(chunk_size, pos - floor)
+            pos -= read_size
+            lines = (os.pread(fd, read_size, pos) + pending).split(b"\n")
+            pending = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if floor == 0 and pending.strip():
+            yield pending
+    except OSError:
+        return
+    finally:
+        os.close(fd)
+
+
+class _SessionTail:
+    """Incrementally maintained tail of a local session file.
+
+    Holds the last lines of the file (at most max_lines, and at most max_bytes
+    in total, mirroring read_jsonl_tail's window) plus the byte offset read
+    so far, so each update only reads what was appended since the last one.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 64 * 1024, max_lines: int = 50) -> None:
+        self.path = path
+        self._max_bytes = max_bytes
+        self._max_lines = max_lines
+        self._lines: deque[bytes] = deque()
+        self._held = 0  # bytes in _lines, counting newlines
+        self._offset = 0  # file offset just past the last complete line consumed
+        self._ino: int | None = None
+
+    def update(self, st: os.stat_result) -> None:
+        """Consume whatever was appended since the last update."""
+        if st.st_ino != self._ino or st.st_size < self._offset:
+            # New or truncated file: start over
+            self._ino = st.st_ino
+            self._offset = 0
+            self._lines.clear()
+            self._held = 0
+        if st.st_size == self._offset:
+            return
+
+        start = self._offset
+        skip_partial = False
+        if st.st_size - start > self._max_bytes:
+            # Too much to catch up on; everything before the window is stale
+            start = st.st_size - self._max_bytes
+            skip_partial = True
+            self._lines.clear()
+            self._held = 0
+
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                buf = f.read(st.st_size - start)
+        except OSError:
+            return
+
+        begin = buf.find(b"\n") + 1 if skip_partial else 0
+        end = buf.rfind(b"\n")
+        if end < begin:
+            return  # no complete line yet
+        self._offset = start + end + 1
+        for line in buf[begin:end].split(b"\n"):
+            if line.strip():
+                self._lines.append(line)
+                self._held += len(line) + 1
+        while self._lines and (len(self._lines) > self._max_lines or self._held > self._max_bytes):
+            self._held -= len(self._lines.popleft()) + 1
+
+    def read_lines(self, _path: Path | None = None) -> list[bytes]:
+        """The held lines, oldest first; usable as a watcher read_lines callable."""
+        return list(self._lines)
+
+
+def _recent_lines(
+    session_path: Path, read_lines: Callable[[Path], list[str]]
+) -> Iterable[str | bytes]:
+    """The last 50 lines of a session, newest first.
+
+    The default local reader scans backwards lazily; custom readers (SSH,
+    SQLite) still return a list that we walk in reverse.
+    """
+    if read_lines is read_jsonl_tail:
+        return itertools.islice(_iter_lines_reverse(session_path), 50)
+    return reversed(read_lines(session_path)[-50:])
+
+
+def _parse_entry(line: str | bytes) -> dict | None:
+    """Decode one JSONL line, or None if it isn't a JSON object."""
+    try:
+        entry = fastjson.loads(line)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+_TS_KEY_BYTES = b'"timestamp"'
+_TS_KEY_STR = '"timestamp"'
+_TS_VALUE_BYTES = re.compile(rb'"timestamp"\s*:\s*"([^"]*)"')
+_TS_VALUE_STR = re.compile(r'"timestamp"\s*:\s*"([^"]*)"')
+
+
+def _scan_timestamp(line: str | bytes) -> float | None:
+    """Read an entry's timestamp straight from the raw line, without parsing JSON.
+
+    Only trusted when "timestamp" occurs exactly once (so it can't be a nested
+    key); returns None when the caller should fall back to a full parse.
+    """
+    if isinstance(line, bytes):
+        if line.count(_TS_KEY_BYTES) != 1:
+            return None
+        match = _TS_VALUE_BYTES.search(line)
+        value = match.group(1).decode("ascii", "replace") if match else None
+    else:
+        if line.count(_TS_KEY_STR) != 1:
+            return None
+        match = _TS_VALUE_STR.search(line)
+        value = match.group(1) if match else None
+    return parse_timestamp(value) if value else None
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_timestamp(ts_str: str) -> float | None:
-    """Parse an ISO timestamp string to Unix timestamp."""
+    """Parse an ISO timestamp string to Unix timestamp.
+
+    Memoized: each pass re-reads the same trailing lines, so most timestamps
+    have been seen before. fromisoformat handles a trailing "Z" natively on 3.11+.
+    """
     if not ts_str:
         return None
     try:
-        return datetime.fromisoformat(ts_str.replace("Z", "+00:00")).timestamp()
+        return datetime.fromisoformat(ts_str).timestamp()
     except ValueError:
         return None
 
@@ -120,21 +272,15 @@ def get_latest_activity(
     Returns (message, timestamp) tuple, or None if no activity found.
     The timestamp can be used to detect genuinely new activity.
     """
-    lines = read_lines(session_path)
-
     # Most recent first, limit to last 50 entries
-    for line in reversed(lines[-50:]):
-        try:
-            entry = json.loads(line)
-            activity = describe_activity(entry)
-            if activity:
-                ts = entry.get("timestamp", "")
-                return (activity, ts)
-        except json.JSONDecodeError:
+    for line in _recent_lines(session_path, read_lines):
+        entry = _parse_entry(line)
+        if entry is None:
             continue
-
-    if lines:
-        _log.info("no activity found in %s (%d lines)", session_path.name, len(lines))
+        activity = describe_activity(entry)
+        if activity:
+            ts = entry.get("timestamp", "")
+            return (activity, ts)
 
     return None
 
@@ -149,16 +295,17 @@ def has_activity_since(
 
     Returns the triggering entry if found, None otherwise.
     """
-    lines = read_lines(session_path)
-
-    for line in reversed(lines[-50:]):
-        try:
-            entry = json.loads(line)
-            ts = parse_timestamp(entry.get("timestamp", ""))
-            if ts and ts > since_time and should_dismiss(entry):
-                return entry
-        except json.JSONDecodeError:
+    for line in _recent_lines(session_path, read_lines):
+        # Most tail entries predate since_time; reject those before decoding them
+        hint = _scan_timestamp(line)
+        if hint is not None and hint <= since_time:
             continue
+        entry = _parse_entry(line)
+        if entry is None:
+            continue
+        ts = parse_timestamp(entry.get("timestamp", ""))
+        if ts and ts > since_time and should_dismiss(entry):
+            return entry
 
     return None
 
@@ -174,16 +321,17 @@ def check_needs_attention(
     Scans recent entries for "turn complete" signals (e.g., OpenClaw's stopReason: "stop").
     Returns the triggering entry if found, None otherwise.
     """
-    lines = read_lines(session_path)
-
-    for line in reversed(lines[-50:]):
-        try:
-            entry = json.loads(line)
-            ts = parse_timestamp(entry.get("timestamp", ""))
-            if ts and ts > since_time and needs_attention(entry):
-                return entry
-        except json.JSONDecodeError:
+    for line in _recent_lines(session_path, read_lines):
+        # Most tail entries predate since_time; reject those before decoding them
+        hint = _scan_timestamp(line)
+        if hint is not None and hint <= since_time:
             continue
+        entry = _parse_entry(line)
+        if entry is None:
+            continue
+        ts = parse_timestamp(entry.get("timestamp", ""))
+        if ts and ts > since_time and needs_attention(entry):
+            return entry
 
     return None
 
@@ -289,26 +437,71 @@ def _archive_stale_sessions(
     return archived
 
 
+ChannelUpdate = tuple[str, str | None, bool]
+"""(channel, new message or None, mark read) as passed to apply_updates."""
+
+
+class StopWatching(Exception):
+    """Raised by a callback to end the watch loop (e.g. its app has exited)."""
+
+
+def _per_channel_updates(
+    mark_read: Callable[[str], int] | None,
+    update_message: Callable[[str, str], int] | None,
+) -> Callable[[list[ChannelUpdate]], object]:
+    """Adapt separate mark_read/update_message callbacks to an apply_updates batch."""
+    if mark_read is None or update_message is None:
+        raise TypeError("either apply_updates or both mark_read and update_message are required")
+
+    def apply_updates(updates: list[ChannelUpdate]) -> None:
+        for channel, message, read in updates:
+            if read:
+                mark_read(channel)
+            if message is not None:
+                update_message(channel, message)
+
+    return apply_updates
+
+
 def unified_watch_loop(
     backends: list[WatcherBackend],
     get_active: Callable[[], list[tuple[str, str, str, float, bool, str | None, str, str | None]]],
-    mark_read: Callable[[str], int],
-    update_message: Callable[[str, str], int],
+    mark_read: Callable[[str], int] | None = None,
+    update_message: Callable[[str, str], int] | None = None,
     archive_channel: Callable[[str], None] | None = None,
     mark_unread: Callable[[str], int] | None = None,
     poll_interval: float = 0.5,
+    idle_interval: float = 2.0,
+    apply_updates: Callable[[list[ChannelUpdate]], object] | None = None,
 ) -> None:
     """Main watch loop - polls all active sessions across all backends.
 
+    Between passes the loop blocks until a local session file changes (see
+    filewait), so an idle inbox is re-scanned every idle_interval rather than
+    every poll_interval. Passes never run closer together than poll_interval.
+    Backends with their own read_lines (remote/SQLite) can't be waited on, so
+    they are polled, backing off from poll_interval toward idle_interval while
+    passes find nothing new.
+
+    Read/message updates found during a pass are handed to apply_updates once
+    at the end of the pass, so a caller can write them in one transaction.
+    Callers that only provide mark_read and update_message get them called
+    per channel instead.
+
     Args:
         backends: List of watcher backends (claude, codex, etc.)
         get_active: Callback returning list of (channel, session_id, cwd, created_at, is_unread, tty, db_message, switch_source)
-        mark_read: Callback to mark a channel as read
-        update_message: Callback to update message for a channel
+        mark_read: Callback to mark a channel as read (unused if apply_updates is given)
+        update_message: Callback to update message for a channel (unused if apply_updates is given)
         archive_channel: Optional callback to archive a channel when session exits
         mark_unread: Optional callback to mark a channel as needing attention (for backends like OpenClaw)
-        poll_interval: How often to poll (seconds)
+        poll_interval: Minimum time between passes (seconds)
+        idle_interval: Longest wait between passes while nothing changes (seconds)
+        apply_updates: Callback receiving each pass's (channel, message, mark_read) updates
     """
+    if apply_updates is None:
+        apply_updates = _per_channel_updates(mark_read, update_message)
+
     # Build prefix -> backend mapping
     backend_map = {b.CHANNEL_PREFIX: b for b in backends}
     _log.info("watcher started with backends: %s", list(backend_map.keys()))
@@ -318,25 +511,50 @@ def unified_watch_loop(
     last_observed_ts: dict[str, float] = {}
     # Track last "needs attention" timestamp per channel to avoid re-marking
     last_attention_ts: dict[str, float] = {}
+    # Channels already logged as having no describable activity, so an idle
+    # session doesn't write the same log line on every pass
+    quiet_channels: set[str] = set()
+    # (mtime_ns, size, created_at, is_unread) as of the last full check, per
+    # session: if none of it changed, re-reading the tail can't change the outcome
+    checked_state: dict[str, tuple[int, int, float, bool]] = {}
+    # Incremental tails for local session files, keyed like session_cache
+    tails: dict[str, _SessionTail] = {}
     # Cache session paths
     session_cache: dict[str, Path] = {}
+    waiter = make_file_waiter()
+    # Consecutive passes that changed nothing; polled backends back off with it
+    idle_passes = 0
 
     while True:
+        pass_started = time.monotonic()
+        # Local files we can wait on; any session we can only poll forces a short wait
+        watched: set[Path] = set()
+        must_poll = False
+        changed = False
+        # Pending (channel, message, mark_read) writes, flushed once per pass,
+        # and the session keys they came from
+        updates: list[ChannelUpdate] = []
+        update_keys: list[str] = []
         try:
+            seen_keys: set[str] = set()
             active = get_active()
 
             # Archive stale sessions: group by TTY and keep only the newest per TTY
             if archive_channel:
                 archived_channels = _archive_stale_sessions(active, archive_channel)
+                changed = changed or bool(archived_channels)
                 # Remove archived channels from active list
                 active = [s for s in active if s[0] not in archived_channels]
                 # Clean up caches for archived channels
                 for channel in archived_channels:
                     last_observed_ts.pop(channel, None)
+                    quiet_channels.discard(channel)
                     # Find and remove from session_cache
                     to_remove = [k for k in session_cache if k.startswith(f"{channel}:")]
                     for k in to_remove:
                         session_cache.pop(k, None)
+                        checked_state.pop(k, None)
+                        tails.pop(k, None)
 
             for (
                 channel,
@@ -345,7 +563,7 @@ def unified_watch_loop(
                 created_at,
                 is_unread,
                 _tty,
-                _db_message,
+                db_message,
                 _switch_source,
             ) in active:
                 # Find the right backend for this channel
@@ -363,6 +581,7 @@ def unified_watch_loop(
 
                 # Get session path (with caching)
                 cache_key = f"{channel}:{session_id}"
+                seen_keys.add(cache_key)
                 session_path = session_cache.get(cache_key)
                 if not session_path:
                     session_path = backend.get_session_path(session_id, cwd)
@@ -370,7 +589,28 @@ def unified_watch_loop(
                         continue
                     session_cache[cache_key] = session_path
 
+                state = None
+                if read_fn is read_jsonl_tail:
+                    watched.add(session_path)
+                    try:
+                        st = session_path.stat()
+                    except OSError:
+                        checked_state.pop(cache_key, None)
+                        tails.pop(cache_key, None)
+                        continue
+                    state = (st.st_mtime_ns, st.st_size, created_at, is_unread)
+                    if checked_state.get(cache_key) == state:
+                        continue
+                    tail = tails.get(cache_key)
+                    if tail is None or tail.path != session_path:
+                        tail = tails[cache_key] = _SessionTail(session_path)
+                    tail.update(st)
+                    read_fn = tail.read_lines
+                else:
+                    must_poll = True
+
                 # For unread notifications, check if we should mark as read
+                dismissed = False
                 if is_unread:
                     dismiss_entry = has_activity_since(
                         session_path, created_at, backend.should_dismiss, read_fn
@@ -378,7 +618,7 @@ def unified_watch_loop(
                     if dismiss_entry:
                         entry_type = dismiss_entry.get("type", "?")
                         entry_ts = dismiss_entry.get("timestamp", "")[:19]
-                        mark_read(channel)
+                        dismissed = True
                         _log.info(
                             "marked read: %s (trigger: %s at %s)", channel, entry_type, entry_ts
                         )
@@ -399,6 +639,7 @@ def unified_watch_loop(
                             if entry_ts:
                                 last_attention_ts[channel] = entry_ts
                             mark_unread(channel)
+                            changed = True
                             _log.info(
                                 "marked unread: %s (agent waiting at %s)",
                                 channel,
@@ -410,19 +651,63 @@ def unified_watch_loop(
                 # If timestamp unchanged, we don't write - this preserves whatever is
                 # in the DB (e.g., a late "Permission needed" from notify handler).
                 # When Claude makes progress, new entries arrive with new timestamps.
+                new_message = None
                 result = get_latest_activity(session_path, backend.describe_activity, read_fn)
+                if result is None and channel not in quiet_channels:
+                    quiet_channels.add(channel)
+                    _log.info("no activity found in %s", session_path.name)
                 if result:
+                    quiet_channels.discard(channel)
                     message, entry_ts_str = result
                     entry_ts = parse_timestamp(entry_ts_str)
                     if entry_ts and entry_ts != last_observed_ts.get(channel):
-                        update_message(channel, message)
                         last_observed_ts[channel] = entry_ts
-                        _log.info("updated %s: %s", channel, message)
-
+                        # Agents often log several entries with the same summary
+                        # (e.g. a run of tool calls); those don't need a write.
+                        if message != db_message:
+                            new_message = message
+                            _log.info("updated %s: %s", channel, message)
+
+                if dismissed or new_message is not None:
+                    updates.append((channel, new_message, dismissed))
+                    update_keys.append(cache_key)
+                    changed = True
+
+                if state is not None:
+                    checked_state[cache_key] = state
+
+            if updates:
+                try:
+                    apply_updates(updates)
+                except Exception:
+                    # Nothing was written: forget these checks so the next pass redoes them
+                    for channel, _message, _read in updates:
+                        last_observed_ts.pop(channel, None)
+                    for key in update_keys:
+                        checked_state.pop(key, None)
+                    raise
+
+            # Drop tails (and the lines they hold) for sessions no longer active
+            for key in tails.keys() - seen_keys:
+                del tails[key]
+
+        except StopWatching:
+            _log.info("watcher stopped")
+            return
         except Exception as e:
             _log.error("error: %s", e, exc_info=True)
 
-        time.sleep(poll_interval)
+        # Polled sessions back off exponentially (up to idle_interval) while
+        # nothing changes, and snap back to poll_interval on any change.
+        idle_passes = 0 if changed else idle_passes + 1
+        if must_poll:
+            timeout = min(idle_interval, poll_interval * 2 ** min(idle_passes, 4))
+        else:
+            timeout = idle_interval
+        waiter.wait(watched, timeout)
+        remaining = poll_interval - (time.monotonic() - pass_started)
+        if remaining > 0:
+            time.sleep(remaining)
 
 
 _watcher_thread: threading.Thread | None = None
@@ -431,20 +716,22 @@ _watcher_thread: threading.Thread | None = None
 def start_unified_watcher(
     backends: list[WatcherBackend],
     get_active: Callable[[], list[tuple[str, str, str, float, bool, str | None, str, str | None]]],
-    mark_read: Callable[[str], int],
-    update_message: Callable[[str, str], int],
+    mark_read: Callable[[str], int] | None = None,
+    update_message: Callable[[str, str], int] | None = None,
     archive_channel: Callable[[str], None] | None = None,
     mark_unread: Callable[[str], int] | None = None,
+    apply_updates: Callable[[list[ChannelUpdate]], object] | None = None,
 ) -> None:
     """Start the unified session watcher daemon thread.
 
     Args:
         backends: List of watcher backends to monitor
         get_active: Callback returning list of (channel, session_id, cwd, created_at, is_unread, tty, db_message, switch_source)
-        mark_read: Callback to mark a channel as read
-        update_message: Callback to update message for a channel
+        mark_read: Callback to mark a channel as read (unused if apply_updates is given)
+        update_message: Callback to update message for a channel (unused if apply_updates is given)
         archive_channel: Optional callback to archive a channel when session exits
         mark_unread: Optional callback to mark a channel as needing attention
+        apply_updates: Callback receiving each pass's (channel, message, mark_read) updates
     """
     global _watcher_thread
 
@@ -454,6 +741,7 @@ def start_unified_watcher(
     _watcher_thread = threading.Thread(
         target=unified_watch_loop,
         args=(backends, get_active, mark_read, update_message, archive_channel, mark_unread),
+        kwargs={"apply_updates": apply_updates},
         daemon=True,
     )
     _watcher_thread.start()
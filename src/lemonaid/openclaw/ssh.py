@@ -10,6 +10,7 @@ import re
 import shlex
 import subprocess
 
+from ..lemon_watchers import lines_reverse
 from ..log import get_logger
 from .utils import _extract_text_from_content
 
@@ -187,9 +188,7 @@ def get_last_user_message(host: str, path: str, max_bytes: int = 64 * 1024) -> s
     if not output:
         return None
 
-    lines = output.strip().split("\n")
-
-    for line in reversed(lines):
+    for line in lines_reverse(output):
         try:
             entry = json.loads(line)
         except json.JSONDecodeError:
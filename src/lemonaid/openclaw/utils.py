@@ -4,6 +4,8 @@ import json
 import re
 from pathlib import Path
 
+from ..lemon_watchers import lines_reverse
+
 
 def get_agents_root() -> Path:
     """Return the OpenClaw agents root directory."""
@@ -208,10 +210,8 @@ def get_last_user_message(session_path: Path, max_bytes: int = 64 * 1024) -> str
                 f.readline()  # Skip partial line
             content = f.read()
 
-        lines = content.strip().split("\n")
-
         # Search from end for user message
-        for line in reversed(lines):
+        for line in lines_reverse(content):
             try:
                 entry = json.loads(line)
             except json.JSONDecodeError:
@@ -21,6 +21,7 @@ from pathlib import Path
 
 from ..config import load_config
 from ..inbox import db
+from ..lemon_watchers import first_line
 from ..lemon_watchers.watcher import read_jsonl_tail
 from ..log import get_logger
 from .utils import find_session_path
@@ -122,6 +123,10 @@ def describe_activity(entry: dict) -> str | None:
     return None
 
 
+_DISMISS_ROLES = frozenset({"assistant", "user"})
+_DISMISS_ENTRY_TYPES = frozenset({"custom_message", "compaction"})
+
+
 def should_dismiss(entry: dict) -> bool:
     """Check if a session entry indicates we should dismiss the notification.
 
@@ -137,10 +142,11 @@ def should_dismiss(entry: dict) -> bool:
     if entry_type == "message":
         msg = entry.get("message", {})
         role = entry.get("role") or msg.get("role")
-        if role in ("assistant", "user"):
+        # Set lookups hash the value, so non-string (e.g. list/dict) JSON values are skipped
+        if isinstance(role, str) and role in _DISMISS_ROLES:
             return True
 
-    return entry_type in ("custom_message", "compaction")
+    return isinstance(entry_type, str) and entry_type in _DISMISS_ENTRY_TYPES
 
 
 def needs_attention(entry: dict) -> bool:
@@ -178,12 +184,7 @@ def _describe_message(entry: dict) -> str | None:
 def _describe_content(content: list | str) -> str | None:
     """Describe content from a message entry."""
     if isinstance(content, str):
-        if content.strip():
-            first_line = content.strip().split("\n")[0][:200]
-            if len(first_line) < len(content.strip().split("\n")[0]):
-                first_line += "..."
-            return first_line
-        return None
+        return first_line(content)
 
     if not isinstance(content, list):
         return None
@@ -200,11 +201,8 @@ def _describe_content(content: list | str) -> str | None:
 
         if block_type in ("text", "output_text"):
             text = block.get("text", "")
-            if text.strip():
-                first_line = text.strip().split("\n")[0][:200]
-                if len(first_line) < len(text.strip().split("\n")[0]):
-                    first_line += "..."
-                return first_line
+            if summary := first_line(text):
+                return summary
 
     return None
 
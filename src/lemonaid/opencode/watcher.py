@@ -1,10 +1,11 @@
 """OpenCode session watcher backend."""
 
-import json
 import sqlite3
 from datetime import UTC, datetime
 from pathlib import Path
 
+from .. import fastjson
+from ..lemon_watchers import first_line
 from .utils import get_db_path
 
 CHANNEL_PREFIX = "opencode:"
@@ -58,16 +59,16 @@ def read_lines(session_path: Path) -> list[str]:
     lines: list[str] = []
     for part_data_raw, ts_ms, message_data_raw in rows:
         try:
-            part_data = json.loads(part_data_raw)
-            message_data = json.loads(message_data_raw)
-        except (TypeError, json.JSONDecodeError):
+            part_data = fastjson.loads(part_data_raw)
+            message_data = fastjson.loads(message_data_raw)
+        except (TypeError, ValueError):
             continue
 
         if not isinstance(ts_ms, int):
             continue
 
         lines.append(
-            json.dumps(
+            fastjson.dumps(
                 {
                     "timestamp": _to_iso(ts_ms),
                     "type": "part",
@@ -133,11 +134,8 @@ def describe_activity(entry: dict) -> str | None:
 
     if part_type == "text":
         text = part.get("text", "")
-        if isinstance(text, str) and text.strip():
-            first_line = text.strip().split("\n")[0][:200]
-            if len(first_line) < len(text.strip().split("\n")[0]):
-                first_line += "..."
-            return first_line
+        if isinstance(text, str) and (summary := first_line(text)):
+            return summary
 
     if part_type == "step-start":
         return "Working..."
@@ -145,6 +143,10 @@ def describe_activity(entry: dict) -> str | None:
     return None
 
 
+_DISMISS_ROLES = frozenset({"assistant", "user"})
+_DISMISS_PART_TYPES = frozenset({"tool", "reasoning", "text", "step-start", "step-finish"})
+
+
 def should_dismiss(entry: dict) -> bool:
     """Check if a session entry indicates we should dismiss notification."""
     role = entry.get("role")
@@ -152,10 +154,12 @@ def should_dismiss(entry: dict) -> bool:
     if not isinstance(part, dict):
         return False
 
-    if role in ("assistant", "user"):
+    # Set lookups hash the value, so non-string (e.g. list/dict) JSON values are skipped
+    if isinstance(role, str) and role in _DISMISS_ROLES:
         return True
 
-    return part.get("type") in ("tool", "reasoning", "text", "step-start", "step-finish")
+    part_type = part.get("type")
+    return isinstance(part_type, str) and part_type in _DISMISS_PART_TYPES
 
 
 def needs_attention(entry: dict) -> bool:
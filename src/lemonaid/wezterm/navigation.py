@@ -4,8 +4,11 @@ import base64
 import json
 import os
 import subprocess
+import time
 from pathlib import Path
 
+from .. import fastjson
+
 
 def get_state_path() -> Path:
     """Get the path to the lemonaid state directory."""
@@ -19,6 +22,39 @@ def get_back_file() -> Path:
     return get_state_path() / "back.json"
 
 
+# How long a `wezterm cli list` result is reused. Switching panes needs the
+# list twice (resolve the target, record the current pane for 'back'), and
+# notification bursts need it repeatedly; each call costs a wezterm process.
+_LIST_PANES_TTL = 0.5
+# A hung mux server shouldn't freeze a switch; callers fall back to metadata.
+_LIST_PANES_TIMEOUT = 2
+_panes_cache: tuple[float, list[dict]] | None = None
+
+
+def list_panes() -> list[dict]:
+    """Return the pane list from `wezterm cli list`, reusing a very recent result.
+
+    Raises subprocess.CalledProcessError, subprocess.TimeoutExpired or
+    ValueError if wezterm fails, hangs, or prints something that isn't JSON.
+    """
+    global _panes_cache
+
+    now = time.monotonic()
+    if _panes_cache is not None and now - _panes_cache[0] < _LIST_PANES_TTL:
+        return _panes_cache[1]
+
+    result = subprocess.run(
+        ["wezterm", "cli", "list", "--format", "json"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+        timeout=_LIST_PANES_TIMEOUT,
+    )
+    panes = fastjson.loads(result.stdout)
+    _panes_cache = (now, panes)
+    return panes
+
+
 def get_current_pane() -> tuple[str | None, int | None]:
     """Get the currently active WezTerm workspace and pane_id.
 
@@ -37,19 +73,11 @@ def get_current_pane() -> tuple[str | None, int | None]:
 
     # Look up the workspace for this pane
     try:
-        result = subprocess.run(
-            ["wezterm", "cli", "list", "--format", "json"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        panes = json.loads(result.stdout)
-
-        for pane in panes:
+        for pane in list_panes():
             if pane.get("pane_id") == pane_id:
                 return pane.get("workspace"), pane_id
 
-    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError):
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, ValueError, KeyError):
         pass
 
     return None, None
@@ -75,6 +103,9 @@ def load_back_location() -> tuple[str | None, int | None]:
         return None, None
 
 
+_SWITCH_SEQ_PREFIX = b"\033]1337;SetUserVar=switch_workspace_and_pane="
+
+
 def switch_to_pane(workspace: str, pane_id: int, save_current: bool = True) -> bool:
     """
     Switch to a WezTerm workspace and pane via escape sequence.
@@ -88,14 +119,13 @@ def switch_to_pane(workspace: str, pane_id: int, save_current: bool = True) -> b
             save_back_location(current_ws, current_pane)
 
     # Send the escape sequence to switch
-    value = f"{workspace}|{pane_id}"
-    encoded = base64.b64encode(value.encode()).decode()
-    seq = f"\033]1337;SetUserVar=switch_workspace_and_pane={encoded}\007"
+    encoded = base64.b64encode(f"{workspace}|{pane_id}".encode())
+    seq = _SWITCH_SEQ_PREFIX + encoded + b"\007"
 
     try:
         fd = os.open("/dev/tty", os.O_WRONLY)
         try:
-            os.write(fd, seq.encode())
+            os.write(fd, seq)
         finally:
             os.close(fd)
         return True
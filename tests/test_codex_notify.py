@@ -0,0 +1,42 @@
+"""Tests for lemonaid.codex.notify module."""
+
+import io
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from lemonaid.codex import notify
+
+
+def _stdin(data: bytes) -> SimpleNamespace:
+    return SimpleNamespace(buffer=io.BytesIO(data))
+
+
+def test_oversized_stdin_is_logged_and_ignored(monkeypatch):
+    """A payload over the cap is reported instead of parsed as an empty dict."""
+    payload = json.dumps({"session_id": "abc", "pad": "x" * notify._STDIN_MAX_BYTES}).encode()
+    monkeypatch.setattr(notify.sys, "stdin", _stdin(payload))
+
+    with (
+        patch("lemonaid.codex.notify._log") as mock_log,
+        patch("lemonaid.codex.notify.db.connect") as mock_connect,
+    ):
+        notify.handle_notification()
+        monkeypatch.setattr(notify.sys, "stdin", _stdin(payload))
+        notify.handle_dismiss()
+
+    assert mock_log.warning.call_count == 2
+    mock_connect.assert_not_called()
+
+
+def test_stdin_at_the_cap_is_read_whole(monkeypatch):
+    """A payload that fits within the cap is returned unchanged."""
+    payload = b" " * (notify._STDIN_MAX_BYTES - 2) + b"{}"
+    monkeypatch.setattr(notify.sys, "stdin", _stdin(payload))
+    assert notify._read_stdin() == payload
+
+
+def test_log_preview_decodes_bytes():
+    """Byte payloads are logged as text, not as b'...' reprs."""
+    assert notify._log_preview("héllo".encode(), 200) == "héllo"
+    assert notify._log_preview("héllo", 2) == "hé"
@@ -0,0 +1,28 @@
+"""Tests for lemonaid.codex.utils session lookup helpers."""
+
+import json
+import os
+
+from lemonaid.codex import utils
+
+
+def _write_session(path, cwd: str, mtime: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    meta = {"type": "session_meta", "payload": {"id": path.stem, "cwd": cwd}}
+    path.write_text(json.dumps(meta) + "\n")
+    os.utime(path, (mtime, mtime))
+
+
+def test_find_latest_session_for_cwd_picks_newest_match(tmp_path, monkeypatch):
+    """The newest session for the cwd wins, even if other cwds are newer still."""
+    monkeypatch.setattr(utils, "get_sessions_root", lambda: tmp_path)
+    old = tmp_path / "2026" / "01" / "01" / "rollout-old.jsonl"
+    new = tmp_path / "2026" / "01" / "02" / "rollout-new.jsonl"
+    other = tmp_path / "2026" / "01" / "03" / "rollout-other.jsonl"
+    _write_session(old, "/work/proj", 1000.0)
+    _write_session(new, "/work/proj", 2000.0)
+    _write_session(other, "/elsewhere", 3000.0)
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    assert utils.find_latest_session_for_cwd("/work/proj") == new
+    assert utils.find_latest_session_for_cwd("/nowhere") is None
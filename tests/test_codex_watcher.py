@@ -31,3 +31,56 @@ def test_describe_activity_response_item_web_search_call():
 def test_should_dismiss_for_response_item_message():
     entry = {"type": "response_item", "payload": {"type": "message", "role": "assistant"}}
     assert watcher.should_dismiss(entry) is True
+
+
+def test_get_session_path_recent_day_and_fallback(tmp_path, monkeypatch):
+    from datetime import date
+
+    monkeypatch.setattr(watcher, "get_sessions_root", lambda: tmp_path)
+    today = date.today()
+    recent_dir = tmp_path / f"{today.year:04d}" / f"{today.month:02d}" / f"{today.day:02d}"
+    recent_dir.mkdir(parents=True)
+    recent = recent_dir / "rollout-2026-01-01T00-00-00-aaaaaaaa-1111.jsonl"
+    recent.write_text("{}\n")
+    old_dir = tmp_path / "2020" / "01" / "01"
+    old_dir.mkdir(parents=True)
+    old = old_dir / "rollout-2020-01-01T00-00-00-bbbbbbbb-2222.jsonl"
+    old.write_text("{}\n")
+
+    assert watcher.get_session_path("aaaaaaaa-1111", "/cwd") == recent
+    assert watcher.get_session_path("bbbbbbbb-2222", "/cwd") == old
+    assert watcher.get_session_path("cccccccc-3333", "/cwd") is None
+    # Unknown full id, but the 8-char UUID prefix matches an existing file
+    assert watcher.get_session_path("bbbbbbbb-9999", "/cwd") == old
+
+
+def test_response_item_without_payload_dict():
+    """A malformed response_item payload is ignored rather than raising."""
+    entry = {"type": "response_item", "payload": "oops"}
+    assert watcher.describe_activity(entry) is None
+    assert watcher.should_dismiss(entry) is False
+
+
+def test_unhashable_type_and_role_values():
+    """List/dict types and roles are treated as unknown rather than raising."""
+    entries = [
+        {"type": ["x"]},
+        {"type": "message", "role": ["assistant"]},
+        {"type": "response_item", "payload": {"type": {}}},
+        {"type": "response_item", "payload": {"type": "message", "role": {}}},
+    ]
+    for entry in entries:
+        assert watcher.describe_activity(entry) is None
+        assert watcher.should_dismiss(entry) is False
+
+
+def test_describe_function_call_other_tools_and_bad_arguments():
+    """Tools without a special description ignore their (possibly invalid) arguments."""
+    payload = {"type": "function_call", "name": "apply_patch", "arguments": "{not json"}
+    assert watcher.describe_activity({"type": "response_item", "payload": payload}) == (
+        "Using apply_patch"
+    )
+    payload = {"type": "function_call", "name": "read_mcp_resource", "arguments": "[1]"}
+    assert watcher.describe_activity({"type": "response_item", "payload": payload}) == (
+        "Reading resource"
+    )
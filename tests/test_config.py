@@ -1,6 +1,14 @@
 """Tests for configuration parsing."""
 
-from lemonaid.config import KeybindingsConfig, _parse_config
+import tomllib
+
+from lemonaid.config import (
+    Config,
+    KeybindingsConfig,
+    _parse_config,
+    get_default_config,
+    load_config,
+)
 from lemonaid.inbox.tui.app import _build_bindings
 
 
@@ -63,6 +71,15 @@ def test_parse_keybindings_missing_section():
     assert kb.up_down == ""
 
 
+def test_parse_keybindings_ignores_unknown_keys():
+    """Unknown keybinding names in the config are ignored."""
+    data = {"tui": {"keybindings": {"quit": "x", "no_such_action": "z"}}}
+    kb = _parse_config(data).tui.keybindings
+
+    assert kb.quit == "x"
+    assert kb.refresh == "g"
+
+
 def test_build_bindings_single_key():
     """Single key creates one visible binding."""
     bindings = _build_bindings("q", "quit", "Quit")
@@ -101,3 +118,58 @@ def test_build_bindings_hidden():
     assert len(bindings) == 2
     assert bindings[0].show is False
     assert bindings[1].show is False
+
+
+def test_get_handler_first_matching_pattern_wins():
+    """Handlers are matched as globs in declaration order."""
+    config = _parse_config({"handlers": {"claude:*": "wezterm", "*": "tmux"}})
+    assert config.get_handler("claude:abc") == "wezterm"
+    assert config.get_handler("codex:abc") == "tmux"
+
+
+def test_get_handler_no_match():
+    """Channels matching no pattern have no handler."""
+    config = _parse_config({"handlers": {"claude:*": "wezterm"}})
+    assert config.get_handler("codex:abc") is None
+
+
+def test_load_config_reuses_parse_until_file_changes(tmp_path):
+    """load_config returns the cached Config until the file changes."""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('[wezterm]\nresolve_pane = "tty"\n')
+
+    first = load_config(config_path)
+    assert load_config(config_path) is first
+
+    config_path.write_text('[wezterm]\nresolve_pane = "metadata"\n')
+    reloaded = load_config(config_path)
+    assert reloaded is not first
+    assert reloaded.wezterm.resolve_pane == "metadata"
+
+
+def test_load_config_missing_or_empty_file(tmp_path):
+    """A missing or empty config file yields defaults."""
+    assert load_config(tmp_path / "missing.toml") == Config()
+
+    empty = tmp_path / "config.toml"
+    empty.touch()
+    assert load_config(empty) == Config()
+
+
+def test_default_config_parses_to_defaults():
+    """The generated default config file round-trips to the dataclass defaults."""
+    assert _parse_config(tomllib.loads(get_default_config())) == Config()
+
+
+def test_parse_config_sections_keep_defaults_for_missing_keys():
+    """Sections only override the keys they set; unknown keys are ignored."""
+    config = _parse_config(
+        {
+            "tmux-session": {"resume_window": 2, "bogus": 1},
+            "openclaw": {"remote_host": "lemon-grove"},
+        }
+    )
+    assert config.tmux_session.resume_window == 2
+    assert config.tmux_session.templates == {}
+    assert config.openclaw.remote_host == "lemon-grove"
+    assert config.wezterm.resolve_pane == "tty"
@@ -1,9 +1,13 @@
 """Tests for lemonaid.inbox.db module."""
 
+import json
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from lemonaid.inbox import db
+from lemonaid.inbox.cli import _notification_to_json
 
 
 def test_connect_creates_schema():
@@ -18,6 +22,58 @@ def test_connect_creates_schema():
             assert result is not None
 
 
+def test_connect_uses_wal():
+    """connect() should switch the database to WAL with relaxed syncing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_run_migrations_up_to_date_is_noop():
+    """Migrations are discovered once and skipped when user_version is current."""
+    from lemonaid.inbox import migrations
+
+    assert migrations.discover_migrations() is migrations.discover_migrations()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            latest = migrations.discover_migrations()[-1][0]
+            assert migrations.get_current_version(conn) == latest
+            assert migrations.run_migrations(conn) == []
+
+
+def test_latest_per_channel_uses_covering_index():
+    """get_active()'s per-channel aggregate should be answered from an index."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            plan = conn.execute(
+                """
+                EXPLAIN QUERY PLAN
+                SELECT channel, MAX(id) FROM notifications
+                WHERE status != 'archived' GROUP BY channel
+                """
+            ).fetchall()
+            assert any("COVERING INDEX" in row[3] for row in plan)
+
+
+def test_channel_lookup_uses_channel_status_index():
+    """The single-column channel index is superseded by (channel, status, id)."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            names = {
+                row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            }
+            assert "idx_notifications_channel" not in names
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM notifications WHERE channel = ?", ("a",)
+            ).fetchall()
+            assert any("idx_notifications_channel_status_id" in row[3] for row in plan)
+
+
 def test_add_creates_notification():
     """add() should create a new notification."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -95,6 +151,114 @@ def test_add_upsert_updates_read_notification():
             assert n2.status == "unread"  # Reset to unread
 
 
+def test_add_upsert_keeps_user_name():
+    """add() with upsert=True should keep a user-set name and its auto_name."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            n1 = db.add(conn, channel="test:123", message="First", name="auto")
+            db.update_name(conn, n1.id, "mine")
+
+            n2 = db.add(conn, channel="test:123", message="Second", name="auto2", metadata={"a": 1})
+
+            assert n2.name == "mine"
+            assert n2.metadata == {"a": 1, "auto_name": "auto"}
+            assert db.get(conn, n1.id) == n2
+
+
+def test_add_many_inserts_in_one_batch():
+    """add_many() should insert every entry as given, without upserting."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            count = db.add_many(
+                conn,
+                [
+                    ("test:aaa", "First", "a", {"cwd": "/a"}, 100.0, None, "archived"),
+                    ("test:aaa", "Second", None, {}, 200.0, "tmux", "unread"),
+                ],
+            )
+            assert count == 2
+
+            first = db.get_by_channel(conn, "test:aaa", unread_only=False)
+            assert first is not None and first.message == "Second"
+            assert first.switch_source == "tmux" and first.created_at == 200.0
+            assert [n.message for n in db.get_history(conn)] == ["First"]
+
+
+def test_get_unread_uses_partial_index_once_analyzed():
+    """After connect() closes with PRAGMA optimize, get_unread() reads the unread index."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            db.add_many(
+                conn,
+                (
+                    (f"test:{i}", "Done", None, {}, float(i), None, "read" if i % 20 else "unread")
+                    for i in range(200)
+                ),
+            )
+            db.get_unread(conn)
+
+        with db.connect(db_path) as conn:
+            plan = conn.execute(
+                f"""
+                EXPLAIN QUERY PLAN
+                SELECT {db._COLUMNS} FROM notifications
+                WHERE status = 'unread' ORDER BY created_at DESC
+                """
+            ).fetchall()
+            assert any("idx_notifications_unread_created" in row[3] for row in plan)
+
+
+def test_get_active_skips_archived_history_once_analyzed():
+    """After connect() closes with PRAGMA optimize, get_active() reads the active index."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            db.add_many(
+                conn,
+                (
+                    (f"test:{i % 50}", "Done", None, {}, float(i), None, "archived")
+                    for i in range(500)
+                ),
+            )
+            db.add(conn, channel="test:live", message="Live")
+
+        with db.connect(db_path) as conn:
+            assert [n.channel for n in db.get_active(conn)] == ["test:live"]
+            plan = conn.execute(
+                """
+                EXPLAIN QUERY PLAN
+                SELECT channel, MAX(id) FROM notifications
+                WHERE status != 'archived' GROUP BY channel
+                """
+            ).fetchall()
+            assert any("idx_notifications_active_channel" in row[3] for row in plan)
+
+
+def test_mark_read_by_tty_uses_tty_index():
+    """mark_read_by_tty() looks the tty up in an index rather than scanning metadata."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            n1 = db.add(conn, channel="test:a", message="A", metadata={"tty": "/dev/ttys001"})
+            n2 = db.add(conn, channel="test:b", message="B", metadata={"tty": "/dev/ttys002"})
+            assert db.mark_read_by_tty(conn, "/dev/ttys001") == 1
+            assert [n.id for n in db.get_unread(conn)] == [n2.id]
+            assert db.get(conn, n1.id).is_read
+
+            plan = conn.execute(
+                """
+                EXPLAIN QUERY PLAN
+                UPDATE notifications SET status = 'read', read_at = 0
+                WHERE json_extract(metadata, '$.tty') = ? AND status = 'unread'
+                """,
+                ("/dev/ttys002",),
+            ).fetchall()
+            assert any("idx_notifications_unread_tty" in row[3] for row in plan)
+
+
 def test_get_unread_returns_only_unread():
     """get_unread() should only return unread notifications."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -117,12 +281,13 @@ def test_mark_read():
             n = db.add(conn, channel="test:123", message="Test")
             assert not n.is_read
 
-            db.mark_read(conn, n.id)
+            assert db.mark_read(conn, n.id) == "test:123"
 
             updated = db.get(conn, n.id)
             assert updated is not None
             assert updated.is_read
             assert updated.read_at is not None
+            assert db.mark_read(conn, n.id + 1) is None
 
 
 def test_mark_all_read_for_channel():
@@ -178,3 +343,137 @@ def test_notification_from_row():
             assert notification.message == "Test"
             assert notification.name == "my-session"
             assert notification.metadata == {"tty": "/dev/ttys001"}
+
+
+def test_queries_match_from_row():
+    """Positional query results should equal Notification.from_row() on SELECT *."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            db.add(conn, channel="test:aaa", message="A", metadata={"cwd": "/tmp"})
+            db.add(conn, channel="test:bbb", message="B", name="b", switch_source="tmux")
+
+            rows = conn.execute("SELECT * FROM notifications ORDER BY id").fetchall()
+            expected = [db.Notification.from_row(row) for row in rows]
+            assert [db.get(conn, n.id) for n in expected] == expected
+            assert sorted(db.get_active(conn), key=lambda n: n.id) == expected
+            assert db.get_by_channel(conn, "test:bbb") == expected[1]
+
+
+def test_apply_channel_updates():
+    """apply_channel_updates() should mark read and update messages in one go."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            a = db.add(conn, channel="test:aaa", message="Waiting...")
+            b = db.add(conn, channel="test:bbb", message="Waiting...")
+            c = db.add(conn, channel="test:ccc", message="Waiting...")
+
+            count = db.apply_channel_updates(
+                conn,
+                [
+                    ("test:aaa", None, True),
+                    ("test:bbb", "Reading file.py", False),
+                    ("test:ccc", "Running tests", True),
+                ],
+            )
+            assert count == 4
+
+            a2, b2, c2 = (db.get(conn, n.id) for n in (a, b, c))
+            assert a2 is not None and a2.is_read and a2.message == "Waiting..."
+            assert b2 is not None and b2.is_unread and b2.message == "Reading file.py"
+            assert c2 is not None and c2.is_read and c2.message == "Running tests"
+
+            # Repeating the current message writes nothing
+            assert db.apply_channel_updates(conn, [("test:bbb", "Reading file.py", False)]) == 0
+
+
+def test_apply_channel_updates_is_all_or_nothing():
+    """A failure partway through a batch should leave every row untouched."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            a = db.add(conn, channel="test:aaa", message="Waiting...")
+
+            def updates():
+                yield ("test:aaa", "Reading file.py", True)
+                raise RuntimeError("boom")
+
+            with pytest.raises(RuntimeError):
+                db.apply_channel_updates(conn, updates())
+
+            assert db.get(conn, a.id) == a
+            assert not conn.in_transaction
+
+
+def test_get_unread_json_matches_get_unread():
+    """get_unread_json() should encode the same data as get_unread(), in order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            assert json.loads(db.get_unread_json(conn)) == []
+
+            db.add(conn, channel="test:aaa", message="A", created_at=1769258096.1234567)
+            db.add(
+                conn,
+                channel="test:bbb",
+                message='quote " and \\ backslash',
+                name="proj",
+                metadata={"tty": "/dev/ttys001", "nested": {"a": [1, 2.5]}},
+                switch_source="tmux",
+                created_at=1769258097.987654,
+            )
+            read = db.add(conn, channel="test:ccc", message="C")
+            db.mark_read(conn, read.id)
+
+            expected = [_notification_to_json(n) for n in db.get_unread(conn)]
+            assert json.loads(db.get_unread_json(conn)) == expected
+            assert [n["channel"] for n in expected] == ["test:bbb", "test:aaa"]
+
+
+def test_get_watch_targets_matches_get_active():
+    """get_watch_targets() should project get_active() rows that have a session and cwd."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        with db.connect(db_path) as conn:
+            db.add(
+                conn,
+                channel="claude:aaa",
+                message="Working",
+                metadata={"session_id": "aaa", "cwd": "/src", "tty": "/dev/ttys001"},
+                switch_source="tmux",
+            )
+            read = db.add(
+                conn,
+                channel="codex:bbb",
+                message="Done",
+                metadata={"session_id": "bbb", "cwd": "/x"},
+            )
+            db.mark_read(conn, read.id)
+            db.add(conn, channel="other:ccc", message="No session", metadata={"cwd": "/y"})
+            archived = db.add(
+                conn,
+                channel="claude:ddd",
+                message="Gone",
+                metadata={"session_id": "ddd", "cwd": "/z"},
+            )
+            db.archive(conn, archived.id)
+
+            expected = [
+                (
+                    n.channel,
+                    n.metadata["session_id"],
+                    n.metadata["cwd"],
+                    n.created_at,
+                    n.is_unread,
+                    n.metadata.get("tty"),
+                    n.message,
+                    n.switch_source,
+                )
+                for n in db.get_active(conn)
+                if n.metadata.get("session_id") and n.metadata.get("cwd")
+            ]
+            targets = db.get_watch_targets(conn)
+            assert targets == expected
+            assert [t[0] for t in targets] == ["claude:aaa", "codex:bbb"]
+            assert targets[0][4] is True and targets[1][4] is False
@@ -0,0 +1,20 @@
+"""Tests for lemonaid.fastjson."""
+
+import pytest
+
+from lemonaid import fastjson
+
+
+def test_round_trip_str_and_bytes():
+    """loads accepts both str and bytes; dumps returns a str."""
+    obj = {"a": 1, "b": ["x", None], "c": "naïve"}
+    encoded = fastjson.dumps(obj)
+    assert isinstance(encoded, str)
+    assert fastjson.loads(encoded) == obj
+    assert fastjson.loads(encoded.encode()) == obj
+
+
+def test_decode_error_is_stdlib_compatible():
+    """Malformed input raises something catchable as json.JSONDecodeError."""
+    with pytest.raises(fastjson.JSONDecodeError):
+        fastjson.loads('{"truncated": ')
@@ -0,0 +1,46 @@
+"""Tests for lemon_watchers.filewait change notifications."""
+
+import threading
+import time
+
+from lemonaid.lemon_watchers.filewait import _SleepWaiter, make_file_waiter
+
+
+def test_wait_times_out_without_changes(tmp_path):
+    """With nothing written, wait returns False after the timeout."""
+    session = tmp_path / "session.jsonl"
+    session.write_text("{}\n")
+    waiter = make_file_waiter()
+
+    assert waiter.wait({session}, 0.05) is False
+
+
+def test_wait_wakes_on_append(tmp_path):
+    """Appending to a watched file wakes the waiter well before the timeout."""
+    session = tmp_path / "session.jsonl"
+    session.write_text("{}\n")
+    waiter = make_file_waiter()
+    if isinstance(waiter, _SleepWaiter):
+        return  # no notification mechanism on this platform
+
+    waiter.wait({session}, 0)  # register the watch
+
+    def append() -> None:
+        time.sleep(0.05)
+        with open(session, "a") as f:
+            f.write('{"type": "user"}\n')
+
+    writer = threading.Thread(target=append)
+    writer.start()
+    started = time.monotonic()
+    woke = waiter.wait({session}, 5.0)
+    writer.join()
+
+    assert woke is True
+    assert time.monotonic() - started < 2.0
+
+
+def test_wait_tolerates_missing_files(tmp_path):
+    """Paths that don't exist are skipped rather than raising."""
+    waiter = make_file_waiter()
+    assert waiter.wait({tmp_path / "missing.jsonl"}, 0.01) is False
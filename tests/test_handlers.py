@@ -0,0 +1,96 @@
+"""Tests for lemonaid.handlers module."""
+
+import json
+import subprocess
+
+from lemonaid import handlers
+from lemonaid.config import Config, WeztermConfig
+
+
+def test_resolve_pane_from_tty_shares_one_wezterm_call(monkeypatch):
+    """Lookups within the cache TTL reuse a single `wezterm cli list`."""
+    panes = [
+        {"tty_name": "/dev/ttys001", "workspace": "main", "pane_id": 1},
+        {"tty_name": "/dev/ttys002", "workspace": "work", "pane_id": 7},
+    ]
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(panes).encode())
+
+    monkeypatch.setattr(handlers.wezterm.navigation, "_panes_cache", None)
+    monkeypatch.setattr(handlers.subprocess, "run", fake_run)
+
+    assert handlers._resolve_pane_from_tty("/dev/ttys002") == ("work", 7)
+    assert handlers._resolve_pane_from_tty("/dev/ttys001") == ("main", 1)
+    assert handlers._resolve_pane_from_tty("/dev/ttys999") == (None, None)
+    assert len(calls) == 1
+
+
+def test_switch_lookups_share_one_wezterm_call(monkeypatch):
+    """Resolving the target and the current pane reuse one pane listing."""
+    panes = [
+        {"tty_name": "/dev/ttys001", "workspace": "main", "pane_id": 1},
+        {"tty_name": "/dev/ttys002", "workspace": "work", "pane_id": 7},
+    ]
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(panes).encode())
+
+    monkeypatch.setattr(handlers.wezterm.navigation, "_panes_cache", None)
+    monkeypatch.setattr(handlers.subprocess, "run", fake_run)
+    monkeypatch.setenv("WEZTERM_PANE", "1")
+
+    assert handlers._resolve_pane_from_tty("/dev/ttys002") == ("work", 7)
+    assert handlers.wezterm.navigation.get_current_pane() == ("main", 1)
+    assert len(calls) == 1
+
+
+def test_handle_tmux_infers_process_name_from_channel(monkeypatch):
+    """The cwd fallback passes the agent process name derived from the channel."""
+    seen = []
+    monkeypatch.setattr(handlers.tmux.navigation, "get_pane_for_tty", lambda tty: (None, None))
+    monkeypatch.setattr(
+        handlers.tmux.navigation,
+        "get_pane_for_cwd",
+        lambda cwd, process_name: seen.append(process_name) or (None, None),
+    )
+
+    for channel in ("opencode:abc", "claude:abc", "other:abc", "claude", ""):
+        handlers._handle_tmux({"cwd": "/tmp", "channel": channel})
+
+    assert seen == ["opencode", "claude", None, None, None]
+
+
+def test_resolve_pane_from_tty_times_out(monkeypatch):
+    """A hung wezterm yields no pane instead of blocking."""
+
+    def fake_run(cmd, **kwargs):
+        assert kwargs.get("timeout")
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+    monkeypatch.setattr(handlers.wezterm.navigation, "_panes_cache", None)
+    monkeypatch.setattr(handlers.subprocess, "run", fake_run)
+
+    assert handlers._resolve_pane_from_tty("/dev/ttys001") == (None, None)
+
+
+def test_handle_wezterm_falls_back_to_metadata(monkeypatch):
+    """Unresolvable TTYs (and "metadata" mode) switch using workspace/pane_id from metadata."""
+    switched = []
+    monkeypatch.setattr(handlers, "_resolve_pane_from_tty", lambda tty: (None, None))
+    monkeypatch.setattr(
+        handlers.wezterm.navigation,
+        "switch_to_pane",
+        lambda workspace, pane_id: switched.append((workspace, pane_id)) or True,
+    )
+    metadata = {"tty": "/dev/ttys001", "workspace": "main", "pane_id": 0}
+
+    for mode in ("tty", "metadata"):
+        config = Config(wezterm=WeztermConfig(resolve_pane=mode))
+        assert handlers._handle_wezterm(metadata, config) is True
+    assert handlers._handle_wezterm({"tty": "/dev/ttys001"}, Config()) is False
+    assert switched == [("main", 0), ("main", 0)]
@@ -0,0 +1,19 @@
+"""Tests for lemonaid.inbox.cli module."""
+
+from dataclasses import asdict
+
+from lemonaid.inbox import db
+from lemonaid.inbox.cli import _notification_to_json
+
+
+def test_notification_to_json_matches_asdict():
+    """The hand-written JSON dict stays in sync with the Notification fields."""
+    n = db.Notification(
+        id=1,
+        channel="claude:abc",
+        message="Waiting",
+        name="proj",
+        metadata={"cwd": "/tmp", "nested": {"a": [1, 2]}},
+        switch_source="tmux",
+    )
+    assert list(_notification_to_json(n).items()) == list(asdict(n).items())
@@ -4,10 +4,13 @@ import json
 from datetime import UTC, datetime
 
 from lemonaid.lemon_watchers import (
+    first_line,
     fish_path,
     get_latest_activity,
     has_activity_since,
+    lines_reverse,
     parse_timestamp,
+    shorten_path,
 )
 
 
@@ -49,6 +52,15 @@ def test_has_activity_since(tmp_path):
     assert not has_activity_since(session, since, lambda e: e.get("type") == "dismiss")
 
 
+def test_shorten_path_under_home(monkeypatch):
+    monkeypatch.setattr("lemonaid.lemon_watchers.common._HOME_PREFIX", "/Users/peter/")
+    assert shorten_path("/Users/peter/play/lemonaid") == "play/lemonaid"
+    assert shorten_path("/Users/peter/play") == "~/play"
+    assert shorten_path("/Users/peter") == "~"
+    assert shorten_path("/Users/peterx/play/") == "peterx/play"
+    assert shorten_path("") == "session"
+
+
 def test_fish_path_under_home(monkeypatch):
     monkeypatch.setattr(
         "lemonaid.lemon_watchers.common.Path.home",
@@ -73,3 +85,91 @@ def test_fish_path_absolute():
 
 def test_fish_path_empty():
     assert fish_path("") == ""
+
+
+def test_iter_lines_reverse_matches_tail_window(tmp_path):
+    """Reverse iteration yields read_jsonl_tail's lines newest-first across chunk boundaries."""
+    from lemonaid.lemon_watchers.watcher import _iter_lines_reverse, read_jsonl_tail
+
+    session = tmp_path / "session.jsonl"
+    session.write_text(
+        "\n".join(f'{{"n": {i}, "pad": "{"x" * (i % 7)}"}}' for i in range(40)) + "\n"
+    )
+
+    expected = list(reversed(read_jsonl_tail(session, max_bytes=300)))
+    got = [line.decode() for line in _iter_lines_reverse(session, max_bytes=300, chunk_size=17)]
+    assert got == expected
+    assert got[0].startswith('{"n": 39')
+
+
+def test_scan_timestamp_compact_and_spaced():
+    """The raw-line scan handles both compact and spaced JSON, str and bytes."""
+    from lemonaid.lemon_watchers.watcher import _scan_timestamp
+
+    expected = parse_timestamp("2026-01-24T12:34:56Z")
+    assert _scan_timestamp(b'{"type":"x","timestamp":"2026-01-24T12:34:56Z"}') == expected
+    assert _scan_timestamp('{"type": "x", "timestamp": "2026-01-24T12:34:56Z"}') == expected
+
+
+def test_scan_timestamp_defers_on_ambiguous_lines():
+    """Nested or missing timestamps fall back to a full parse (None)."""
+    from lemonaid.lemon_watchers.watcher import _scan_timestamp
+
+    nested = b'{"payload":{"timestamp":"2020-01-01T00:00:00Z"},"timestamp":"2026-01-24T12:00:00Z"}'
+    assert _scan_timestamp(nested) is None
+    assert _scan_timestamp(b'{"type":"x"}') is None
+
+
+def test_first_line_truncates_and_skips_blank():
+    assert first_line("  hello\nworld  ") == "hello"
+    assert first_line("x" * 201) == "x" * 200 + "..."
+    assert first_line("x" * 200) == "x" * 200
+    assert first_line(" \n ") is None
+
+
+def test_session_tail_reads_incrementally(tmp_path):
+    """_SessionTail only picks up complete appended lines and resets on truncation."""
+    import os
+
+    from lemonaid.lemon_watchers.watcher import _SessionTail
+
+    session = tmp_path / "session.jsonl"
+    session.write_bytes(b'{"n": 1}\n{"n": 2}\n')
+    tail = _SessionTail(session, max_lines=3)
+    tail.update(os.stat(session))
+    assert tail.read_lines() == [b'{"n": 1}', b'{"n": 2}']
+
+    with open(session, "ab") as f:
+        f.write(b'{"n": 3}\n{"n": 4}\n{"n": 5')  # last line still being written
+    tail.update(os.stat(session))
+    assert tail.read_lines() == [b'{"n": 2}', b'{"n": 3}', b'{"n": 4}']
+
+    with open(session, "ab") as f:
+        f.write(b"}\n")
+    tail.update(os.stat(session))
+    assert tail.read_lines()[-1] == b'{"n": 5}'
+
+    session.write_bytes(b'{"n": 0}\n')  # rewritten from scratch
+    tail.update(os.stat(session))
+    assert tail.read_lines() == [b'{"n": 0}']
+
+
+def test_lines_reverse_skips_blank_lines():
+    """lines_reverse yields non-blank lines newest first."""
+    assert list(lines_reverse('{"a": 1}\n\n{"b": 2}\n  \n')) == ['{"b": 2}', '{"a": 1}']
+    assert list(lines_reverse("")) == []
+
+
+def test_unified_watch_loop_ends_on_stop_watching():
+    """A callback raising StopWatching ends the loop instead of being logged and retried."""
+    from lemonaid.lemon_watchers import StopWatching
+    from lemonaid.lemon_watchers.watcher import unified_watch_loop
+
+    calls = []
+
+    def get_active():
+        calls.append(1)
+        raise StopWatching
+
+    unified_watch_loop([], get_active, apply_updates=lambda updates: None)
+    assert calls == [1]
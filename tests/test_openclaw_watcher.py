@@ -252,6 +252,12 @@ def test_dismiss_non_message():
     assert should_dismiss({}) is False
 
 
+def test_dismiss_unhashable_role_and_type():
+    assert should_dismiss({"type": "message", "role": ["user"]}) is False
+    assert should_dismiss({"type": "message", "message": {"role": {}}}) is False
+    assert should_dismiss({"type": ["compaction"]}) is False
+
+
 # --- needs_attention ---
 
 
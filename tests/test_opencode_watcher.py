@@ -27,6 +27,11 @@ def test_should_dismiss_user_activity():
     assert watcher.should_dismiss(entry) is True
 
 
+def test_should_dismiss_ignores_unhashable_role_and_type():
+    entry = {"role": ["user"], "part": {"type": {"text": "x"}}}
+    assert watcher.should_dismiss(entry) is False
+
+
 def test_needs_attention_on_step_finish_stop():
     entry = {"role": "assistant", "part": {"type": "step-finish", "reason": "stop"}}
     assert watcher.needs_attention(entry) is True
@@ -0,0 +1,19 @@
+"""Tests for lemonaid.claude.patcher."""
+
+from lemonaid.claude import patcher
+
+
+def test_status_cache_keeps_only_definite_results(tmp_path, monkeypatch):
+    """Unknown results aren't cached; a changed binary misses the cache."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    binary = tmp_path / "2.1.20"
+    binary.write_bytes(b"notificationType abc=6000")
+
+    patcher.record_status(binary, "unknown")
+    assert patcher.cached_status(binary) is None
+
+    patcher.record_status(binary, "unpatched")
+    assert patcher.cached_status(binary) == "unpatched"
+
+    binary.write_bytes(b"notificationType abc=0500 changed")
+    assert patcher.cached_status(binary) is None
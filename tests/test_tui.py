@@ -0,0 +1,127 @@
+"""Tests for the lemonaid inbox TUI (run headless via App.run_test)."""
+
+import asyncio
+
+import pytest
+
+from lemonaid.inbox import db
+from lemonaid.inbox.tui import app as tui_app
+
+
+@pytest.fixture
+def make_app(tmp_path, monkeypatch):
+    """Build a LemonaidApp on a fresh database, without the watcher thread or patch check."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("TMUX", raising=False)
+    monkeypatch.delenv("WEZTERM_PANE", raising=False)
+    monkeypatch.setattr(tui_app, "start_unified_watcher", lambda **kwargs: None)
+    monkeypatch.setattr(tui_app, "find_binary", lambda: None)
+    return tui_app.LemonaidApp
+
+
+def _messages(table) -> list[str]:
+    return [table.get_row_at(row)[6].plain for row in range(table.row_count)]
+
+
+def test_watcher_writes_show_on_next_tick(make_app):
+    """Writes on the DB thread's own connection still change the refresh fingerprint."""
+    with db.connect() as conn:
+        db.add(conn, channel="test:a", message="Working")
+
+    async def run():
+        app = make_app()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            # Drive the ticks by hand instead of waiting on the interval timer
+            app._refresh_timer.pause()
+            await app._maybe_refresh()
+            before = app._refresh_fingerprint
+            # Written on the worker connection, like a watcher pass, but without
+            # _watcher_write's immediate refresh: only the next tick can pick it up
+            await asyncio.to_thread(
+                app._run_on_db_thread,
+                lambda conn: db.apply_channel_updates(conn, [("test:a", "Done", True)]),
+            )
+            await app._maybe_refresh()
+            return (
+                before != app._refresh_fingerprint,
+                _messages(app._main_table),
+                app._main_table.get_row_at(0)[1].plain,
+            )
+
+    assert asyncio.run(run()) == (True, ["Done"], "")
+
+
+def test_watcher_write_redraws_without_waiting_for_a_tick(make_app):
+    """A watcher write that changes rows redraws the inbox straight away."""
+    with db.connect() as conn:
+        db.add(conn, channel="test:a", message="Working")
+
+    async def run():
+        app = make_app()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            app._refresh_timer.pause()
+            await app._maybe_refresh()
+            await asyncio.to_thread(app._apply_watcher_updates, [("test:a", "Done", True)])
+            # Let the refresh the write scheduled with call_later run
+            await pilot.pause()
+            return _messages(app._main_table), app._main_table.get_row_at(0)[1].plain
+
+    assert asyncio.run(run()) == (["Done"], "")
+
+
+def test_watcher_callbacks_stop_after_exit(make_app):
+    """Once the app has unmounted, watcher callbacks raise StopWatching."""
+    from lemonaid.lemon_watchers import StopWatching
+
+    async def run():
+        app = make_app()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause(0.1)
+        return app
+
+    app = asyncio.run(run())
+    with pytest.raises(StopWatching):
+        app._get_active_for_watcher()
+    with pytest.raises(StopWatching):
+        app._archive_channel("test:a")
+
+
+def test_refresh_patches_rows_in_place_until_one_is_added(make_app):
+    """Message changes and removals patch the table; an added row rebuilds it."""
+    with db.connect() as conn:
+        notifications = [db.add(conn, channel=f"test:{c}", message=f"msg {c}") for c in "abc"]
+
+    async def run():
+        app = make_app()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause(0.1)
+            app._refresh_timer.pause()
+            table = app._main_table
+            clears = []
+            clear = table.clear
+            table.clear = lambda *args, **kwargs: clears.append(1) or clear(*args, **kwargs)
+            steps = [_messages(table)]
+
+            with db.connect() as conn:
+                db.update_message(conn, "test:b", "msg b2")
+            app._refresh_notifications()
+            steps.append((_messages(table), len(clears)))
+
+            with db.connect() as conn:
+                db.archive(conn, notifications[0].id)
+            app._refresh_notifications()
+            steps.append((_messages(table), len(clears)))
+
+            with db.connect() as conn:
+                db.add(conn, channel="test:d", message="msg d")
+            app._refresh_notifications()
+            steps.append((_messages(table), len(clears)))
+            await pilot.pause(0.1)
+            return steps
+
+    initial, changed, removed, added = asyncio.run(run())
+    assert changed == ([m.replace("msg b", "msg b2") for m in initial], 0)
+    assert removed == ([m for m in changed[0] if m != "msg a"], 0)
+    assert added == (["msg d", *removed[0]], 1)